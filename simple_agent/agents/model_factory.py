@@ -83,13 +83,17 @@ def _create_openai_model(
     temperature: float,
     max_tokens: int,
 ) -> LiteLLMModel:
-    """Create OpenAI model."""
+    """Create OpenAI model (optional base_url for OpenAI-compatible servers)."""
     api_key = config.get("api_key", "")
     api_key = ConfigManager.resolve_env_var(api_key)
+    base_url = config.get("base_url")
+    if base_url:
+        base_url = ConfigManager.resolve_env_var(base_url)
     logger.info("Creating OpenAI model")
     return LiteLLMModel(
         model_id=model_id,
         api_key=api_key,
+        api_base=base_url,
         temperature=temperature,
         max_tokens=max_tokens,
     )
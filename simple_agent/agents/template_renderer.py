@@ -5,16 +5,44 @@ Supports both Jinja2 templates and simple format strings.
 Uses SandboxedEnvironment for security against template injection.
 """
 
+import functools
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from jinja2 import BaseLoader, TemplateError
+from jinja2 import BaseLoader, Template, TemplateError
 from jinja2.sandbox import SandboxedEnvironment
 
 logger = logging.getLogger(__name__)
 
 
+def _now() -> datetime:
+    """Return the current time for template context (patch point for tests)."""
+    return datetime.now()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_jinja_env() -> SandboxedEnvironment:
+    """Build the sandboxed Jinja2 environment shared by all renderers."""
+    return SandboxedEnvironment(
+        loader=BaseLoader(),
+        autoescape=False,  # Not rendering HTML
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> Template:
+    """
+    Compile a Jinja2 template source, memoized on the source string.
+
+    from_string() bypasses Jinja2's own template cache, so agents sharing a
+    role or user_prompt_template would otherwise re-lex and re-parse it.
+    """
+    return _shared_jinja_env().from_string(template)
+
+
 class TemplateRenderer:
     """Renders Jinja2 and format string templates for agent prompts.
 
@@ -22,20 +50,9 @@ class TemplateRenderer:
     attacks by restricting access to dangerous attributes and methods.
     """
 
-    def __init__(self):
-        """Initialize template renderer with sandboxed Jinja2 environment."""
-        self._jinja_env: Optional[SandboxedEnvironment] = None
-
     def _get_jinja_env(self) -> SandboxedEnvironment:
-        """Get configured Jinja2 sandboxed environment (cached)."""
-        if self._jinja_env is None:
-            self._jinja_env = SandboxedEnvironment(
-                loader=BaseLoader(),
-                autoescape=False,  # Not rendering HTML
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-        return self._jinja_env
+        """Get configured Jinja2 sandboxed environment (shared, built once)."""
+        return _shared_jinja_env()
 
     @staticmethod
     def is_jinja_template(template: str) -> bool:
@@ -73,10 +90,11 @@ class TemplateRenderer:
             Dict with context variables for template rendering
         """
         logger.debug("Building template context")
+        now = _now()
         context: Dict[str, Any] = {
             "agent_name": agent_name,
-            "current_time": datetime.now(),
-            "current_date": datetime.now().date(),
+            "current_time": now,
+            "current_date": now.date(),
             "verbosity": verbosity,
             "max_steps": max_steps,
             "model_provider": model_provider,
@@ -117,16 +135,16 @@ class TemplateRenderer:
         if self.is_jinja_template(template):
             # Jinja2 template detected
             try:
-                jinja_env = self._get_jinja_env()
-                jinja_template = jinja_env.from_string(template)
+                jinja_template = _compile_template(template)
                 rendered = jinja_template.render(**context)
                 return rendered.rstrip()
             except TemplateError as e:
                 raise ValueError(f"Jinja2 template error: {e}")
         else:
-            # Simple format string (backward compatibility)
+            # Simple format string (backward compatibility); format_map reads
+            # the context directly instead of unpacking it into kwargs
             try:
-                return template.format(**context)
+                return template.format_map(context)
             except KeyError:
                 # If format() fails due to missing keys, return template as-is
                 return template
@@ -9,7 +9,7 @@ import yaml
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-from simple_agent.core.config_manager import ConfigManager
+from simple_agent.core.config_manager import YAML_DUMPER, ConfigManager
 from simple_agent.commands.common import (
     get_console,
     format_success,
@@ -70,7 +70,10 @@ def config_show(context, resolve):
 
         # Convert config to YAML for pretty display
         config_yaml = yaml.dump(
-            display_config, default_flow_style=False, sort_keys=False
+            display_config,
+            Dumper=YAML_DUMPER,
+            default_flow_style=False,
+            sort_keys=False,
         )
 
         # Syntax highlighting
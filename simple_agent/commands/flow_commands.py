@@ -8,6 +8,8 @@ from rich.table import Table
 
 import yaml
 
+from simple_agent.core.config_manager import YAML_DUMPER
+
 
 class FlowCommands:
     """Provides REPL commands for orchestrator flow management.
@@ -76,7 +78,9 @@ class FlowCommands:
             return f"Flow validation failed: {', '.join(errors)}"
 
         # Convert to YAML for display
-        yaml_str = yaml.dump(flow_def, default_flow_style=False, sort_keys=False)
+        yaml_str = yaml.dump(
+            flow_def, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
 
         # Use Syntax for highlighting
         syntax = Syntax(yaml_str, "yaml", theme="monokai", line_numbers=True)
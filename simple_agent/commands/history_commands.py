@@ -171,10 +171,13 @@ def save(ctx, file: str):
     Save conversation history to a file.
 
     Exports the agent's memory to a JSON file for later review or backup.
+    A .jsonl file gets one step per line instead (no metadata wrapper),
+    so large histories can be streamed or appended to.
 
     Examples:
         /history save history.json
         /history save data/conversations/session_20251023.json
+        /history save history.jsonl
     """
     console: Console = ctx.obj["console"]
     agent_manager = ctx.obj["agent_manager"]
@@ -198,17 +201,21 @@ def save(ctx, file: str):
         console.print("[yellow]No history to save.[/yellow] Memory is empty.\n")
         return
 
-    # Save to JSON file
+    # Save to JSON (or JSON Lines) file
     try:
         with open(file, "w") as f:
-            # Add metadata
-            export_data = {
-                "agent_name": agent_manager.last_agent,
-                "exported_at": datetime.now().isoformat(),
-                "steps": memory_steps,
-                "total_steps": len(memory_steps),
-            }
-            json.dump(export_data, f, indent=2, default=str)
+            if file.endswith(".jsonl"):
+                for step in memory_steps:
+                    f.write(json.dumps(step, default=str) + "\n")
+            else:
+                # Add metadata
+                export_data = {
+                    "agent_name": agent_manager.last_agent,
+                    "exported_at": datetime.now().isoformat(),
+                    "steps": memory_steps,
+                    "total_steps": len(memory_steps),
+                }
+                json.dump(export_data, f, indent=2, default=str)
 
         console.print()
         console.print(
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 from simple_agent.agents.simple_agent import SimpleAgent
 from simple_agent.core.agent_result import AgentResult
+from simple_agent.core.config_manager import YAML_DUMPER, YAML_LOADER
 
 logger = logging.getLogger(__name__)
 
@@ -364,7 +365,7 @@ class AgentManager:
 
         # Load YAML
         with open(yaml_path, "r", encoding="utf-8") as f:
-            agent_data = yaml.safe_load(f)
+            agent_data = yaml.load(f, Loader=YAML_LOADER)
 
         # Validate required field: name
         if not agent_data or "name" not in agent_data:
@@ -482,7 +483,13 @@ class AgentManager:
 
         # Write YAML
         with open(yaml_path, "w", encoding="utf-8") as f:
-            yaml.dump(agent_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                agent_data,
+                f,
+                Dumper=YAML_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
         logger.info(f"Saved agent '{agent_name}' to YAML: {yaml_path}")
 
@@ -1,6 +1,7 @@
 """Agent execution result with token tracking and cost information."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Dict, Optional
 from decimal import Decimal
 
@@ -24,9 +25,14 @@ class AgentResult:
     error: Optional[str] = None  # Error message if execution failed
     error_type: Optional[str] = None  # Error class name (e.g., "ValueError")
 
+    @cached_property
+    def text(self) -> str:
+        """Response as a string, computed once per result."""
+        return str(self.response)
+
     def __str__(self) -> str:
         """Return response as string for backward compatibility."""
-        return str(self.response)
+        return self.text
 
     def __repr__(self) -> str:
         """Return detailed representation."""
@@ -42,7 +48,7 @@ class AgentResult:
             Dict with response, token stats, and error info if applicable
         """
         result = {
-            "response": str(self.response),
+            "response": self.text,
             "tokens": {
                 "input_tokens": self.input_tokens,
                 "output_tokens": self.output_tokens,
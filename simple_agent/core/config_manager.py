@@ -3,6 +3,8 @@ Configuration management module.
 Handles loading, saving, and accessing configuration values.
 """
 
+import copy
+import functools
 import os
 import re
 import yaml
@@ -12,6 +14,37 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader/dumper when PyYAML was built with it, else pure Python
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its resolved path and stat signature.
+
+    mtime_ns and size are part of the cache key so an edited file is re-read.
+    Callers must deep-copy the result before handing it out.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file through the shared parse cache.
+
+    Args:
+        path: Path to an existing YAML file
+
+    Returns:
+        Parsed YAML content, deep-copied so callers may mutate it freely
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return copy.deepcopy(_load_cached(str(resolved), stat.st_mtime_ns, stat.st_size))
+
 
 class ConfigValidationError(ValueError):
     """Raised when config structure validation fails."""
@@ -156,8 +189,7 @@ class ConfigManager:
             raise FileNotFoundError(f"Config file not found: {path}")
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_file(config_path)
 
             if config is None:
                 config = {}
@@ -241,7 +273,13 @@ class ConfigManager:
 
         try:
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
             logger.info(f"Config saved to: {path}")
 
@@ -1,12 +1,32 @@
 """GuardrailAgent wrapper for applying guardrails to SimpleAgent."""
 
-from typing import Any, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
+
+from simple_agent.guardrails.custom_rule import CustomRuleGuardrail
+
+
+def _fuse_custom_rules(guardrails: List[Any]) -> List[Any]:
+    """Merge each run of consecutive CustomRuleGuardrails into one stage."""
+    stages: List[Any] = []
+    run: List[CustomRuleGuardrail] = []
+    for guardrail in [*guardrails, None]:
+        if isinstance(guardrail, CustomRuleGuardrail):
+            run.append(guardrail)
+            continue
+        if run:
+            stages.append(run[0] if len(run) == 1 else CustomRuleGuardrail.fuse(run))
+            run = []
+        if guardrail is not None:
+            stages.append(guardrail)
+    return stages
 
 
 class GuardrailAgent:
     """Wrapper around SimpleAgent that applies input guardrails before execution.
 
     Guardrails are applied in order: each guardrail processes the output of the previous one.
+    Consecutive custom rules run as one fused stage. The pipeline is rebuilt whenever
+    input_guardrails changes, so guardrails added after construction still apply.
     """
 
     def __init__(self, agent: Any, input_guardrails: Optional[List[Any]] = None):
@@ -18,6 +38,17 @@ class GuardrailAgent:
         """
         self.agent = agent
         self.input_guardrails = input_guardrails or []
+        # Bound process() of each stage, cached against the guardrails they were built from
+        self._stages: Tuple[Callable[[str], str], ...] = ()
+        self._stages_key: Tuple[Any, ...] = ()
+
+    def _current_stages(self) -> Tuple[Callable[[str], str], ...]:
+        """Return the pipeline stages, rebuilding them if input_guardrails changed."""
+        key = tuple(self.input_guardrails)
+        if key != self._stages_key:
+            self._stages = tuple(stage.process for stage in _fuse_custom_rules(key))
+            self._stages_key = key
+        return self._stages
 
     def run(self, prompt: str) -> str:
         """Run agent with guardrails applied to input.
@@ -31,10 +62,14 @@ class GuardrailAgent:
         Raises:
             GuardrailViolation: If input guardrails reject the input
         """
+        stages = self._current_stages()
+        if not stages:
+            return self.agent.run(prompt)
+
         # Apply input guardrails in order
         processed_prompt = prompt
-        for guardrail in self.input_guardrails:
-            processed_prompt = guardrail.process(processed_prompt)
+        for process in stages:
+            processed_prompt = process(processed_prompt)
 
         # Run wrapped agent with processed prompt
         response = self.agent.run(processed_prompt)
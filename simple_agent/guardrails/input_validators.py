@@ -1,20 +1,36 @@
 """Input validators for guardrails."""
 
+import functools
 import re
-from typing import List, Literal, Optional
+from typing import Iterable, List, Literal, Optional, Tuple
 
 from simple_agent.guardrails.exceptions import GuardrailViolation
 
 PIIType = Literal["email", "phone", "ssn"]
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_pii_pattern(patterns: Tuple[Tuple[str, str], ...]) -> re.Pattern:
+    """
+    Compile (type, regex) pairs into one alternation of named groups.
+
+    Memoized so detectors with the same enabled types share one compiled
+    pattern instead of each rebuilding it.
+    """
+    return re.compile("|".join(f"(?P<{name}>{regex})" for name, regex in patterns))
+
+
 class PIIDetector:
     """Detect and redact Personally Identifiable Information in text."""
 
-    # Regex patterns for different PII types
+    __slots__ = ("_types", "redact", "_pattern")
+
+    # Regex patterns for different PII types. The leading lookbehinds only let
+    # a match start at the beginning of a run of candidate characters, so long
+    # runs are scanned once rather than once per offset (linear, not quadratic)
     PATTERNS = {
-        "email": r"[\w\.-]+@[\w\.-]+\.\w+",
-        "phone": r"\+?1?\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})",
+        "email": r"(?<![\w\.-])[\w\.-]+@[\w\.-]+\.\w+\b",
+        "phone": r"(?<![\w+])(?:\+?1[-.\s]*)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})",
         "ssn": r"\b\d{3}-?\d{2}-?\d{4}\b",
     }
 
@@ -34,6 +50,29 @@ class PIIDetector:
         self.types = types or ["email", "phone", "ssn"]
         self.redact = redact
 
+    @property
+    def types(self) -> Tuple[PIIType, ...]:
+        """PII types to detect; assign a new sequence to change them."""
+        return self._types
+
+    @types.setter
+    def types(self, types: Iterable[PIIType]) -> None:
+        """Set the PII types and recompile the detection pattern."""
+        # Stored as a tuple so the types cannot change without recompiling
+        self._types = tuple(types)
+        # One alternation over the enabled types, in list order, so process()
+        # scans the text once instead of once per type
+        active = tuple(
+            (t, self.PATTERNS[t]) for t in dict.fromkeys(self._types) if t in self.PATTERNS
+        )
+        self._pattern: Optional[re.Pattern] = (
+            _compile_pii_pattern(active) if active else None
+        )
+
+    def _redact_match(self, match: re.Match) -> str:
+        """Return the redaction token for the PII type that matched."""
+        return self.REDACTION_TOKENS[match.lastgroup]
+
     def process(self, text: str) -> str:
         """Process text to detect and handle PII.
 
@@ -46,28 +85,19 @@ class PIIDetector:
         Raises:
             GuardrailViolation: If PII found and redact=False
         """
-        if not text:
+        if not text or self._pattern is None:
             return text
 
-        result = text
-
-        for pii_type in self.types:
-            if pii_type not in self.PATTERNS:
-                continue
-
-            pattern = self.PATTERNS[pii_type]
-            matches = list(re.finditer(pattern, text))
+        if self.redact:
+            # Redact by replacing each match with its type's token
+            return self._pattern.sub(self._redact_match, text)
 
-            if matches:
-                if self.redact:
-                    # Redact by replacing with token
-                    token = self.REDACTION_TOKENS[pii_type]
-                    result = re.sub(pattern, token, result)
-                else:
-                    # Reject
-                    pii_found = matches[0].group(0)
-                    raise GuardrailViolation(
-                        f"Found {pii_type}: {pii_found}", guardrail_type="pii_detector"
-                    )
+        # Reject on the first PII found
+        match = self._pattern.search(text)
+        if match:
+            raise GuardrailViolation(
+                f"Found {match.lastgroup}: {match.group(0)}",
+                guardrail_type="pii_detector",
+            )
 
-        return result
+        return text
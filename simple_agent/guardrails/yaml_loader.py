@@ -5,6 +5,23 @@ from typing import Any, Dict
 
 import yaml
 
+from simple_agent.core.config_manager import YAML_LOADER
+
+
+def load_guardrails_from_string(yaml_content: str) -> Dict[str, Any]:
+    """Load guardrail configuration from a YAML string.
+
+    Args:
+        yaml_content: YAML configuration text
+
+    Returns:
+        Dictionary with 'input_guardrails' key containing list of guardrail configs
+
+    Raises:
+        yaml.YAMLError: If YAML is malformed
+    """
+    return yaml.load(yaml_content, Loader=YAML_LOADER) or {}
+
 
 def load_guardrails_from_yaml(file_path: str) -> Dict[str, Any]:
     """Load guardrail configuration from YAML file.
@@ -23,7 +40,4 @@ def load_guardrails_from_yaml(file_path: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"YAML file not found: {file_path}")
 
-    with open(path, "r") as f:
-        config = yaml.safe_load(f) or {}
-
-    return config
+    return load_guardrails_from_string(path.read_text(encoding="utf-8"))
@@ -7,9 +7,10 @@ Issue 5-B: Persistence implementation (file-based storage)
 
 import logging
 import uuid
+from collections import deque
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from simple_agent.hitl.approval_persistence import ApprovalPersistence, FileApprovalPersistence
 from simple_agent.hitl.approval_ui import ApprovalUIHandler, ConsoleApprovalUI, QuietApprovalUI
@@ -40,6 +41,7 @@ class ApprovalManager:
         ui_handler: Optional[ApprovalUIHandler] = None,
         persistence: Optional[ApprovalPersistence] = None,
         enable_interactive: bool = True,
+        history_limit: int = 10_000,
     ):
         """Initialize ApprovalManager.
 
@@ -50,13 +52,19 @@ class ApprovalManager:
                         (defaults to FileApprovalPersistence)
             enable_interactive: Whether to actually prompt user
                                (set False for automated/testing)
+            history_limit: Maximum decisions kept in the in-memory history
+                          (oldest dropped first; persistence keeps all)
         """
         self.ui_handler = ui_handler or (ConsoleApprovalUI() if enable_interactive else QuietApprovalUI())
         self.persistence = persistence or FileApprovalPersistence()
         self.enable_interactive = enable_interactive
         self.pending_approval: Optional[Dict[str, Any]] = None
         self.pending_request_id: Optional[str] = None
-        self.history: List[Dict[str, Any]] = []  # In-memory cache
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)  # In-memory cache
+        # Persisted history as last loaded, with the persistence fingerprint it was
+        # loaded at; reset whenever this manager writes
+        self._persisted_history: Optional[List[Dict[str, Any]]] = None
+        self._persisted_fingerprint: Optional[Tuple[int, int]] = None
 
     def request_approval(
         self,
@@ -164,6 +172,7 @@ class ApprovalManager:
         # Persist decision
         decision_str = ApprovalDecision.APPROVED.value if approved else ApprovalDecision.REJECTED.value
         self.persistence.save_decision(request_id, decision_str)
+        self._persisted_history = None
 
         # Update in-memory history
         entry = {
@@ -216,18 +225,31 @@ class ApprovalManager:
     def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get approval history from persistence.
 
+        The persisted history is cached and reloaded when this manager records
+        a decision or clears history, or when the persistence fingerprint shows
+        another writer changed it.
+
         Args:
             limit: Maximum number of records to return (None for all)
 
         Returns:
-            List of approval decision records
+            Copies of the approval decision records
         """
-        persisted = self.persistence.load_history(limit)
-        # Return persisted history (source of truth)
-        return persisted
+        fingerprint = self.persistence.history_fingerprint()
+        if (
+            self._persisted_history is None
+            or fingerprint is None
+            or fingerprint != self._persisted_fingerprint
+        ):
+            # Persisted history is the source of truth
+            self._persisted_history = self.persistence.load_history()
+            self._persisted_fingerprint = fingerprint
+        records = self._persisted_history[-limit:] if limit else self._persisted_history
+        return [dict(record) for record in records]
 
     def clear_history(self) -> None:
         """Clear approval history from persistence."""
         self.persistence.clear_history()
         self.history.clear()
+        self._persisted_history = None
         logger.info("Cleared approval history")
@@ -9,7 +9,7 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -88,12 +88,26 @@ class ApprovalPersistence(ABC):
         """
         pass
 
+    def history_fingerprint(self) -> Optional[Tuple[int, int]]:
+        """Return a cheap marker that changes whenever the stored history changes.
+
+        Callers caching load_history() compare fingerprints to decide whether
+        to reload. Backends that cannot provide one return None, meaning the
+        history must be reloaded on every read.
+
+        Returns:
+            Fingerprint tuple, or None if unavailable
+        """
+        return None
+
 
 class FileApprovalPersistence(ApprovalPersistence):
     """File-based approval persistence using JSON.
 
-    Stores approval requests and decisions in a JSON file for persistence
-    across sessions. Each entry includes timestamp and decision information.
+    Stores approval requests in a JSON file and decisions in an append-only
+    JSON Lines history file, so each decision costs one appended line rather
+    than a rewrite of the whole history. Each entry includes timestamp and
+    decision information.
     """
 
     def __init__(self, storage_dir: str = "hitl_data"):
@@ -105,17 +119,45 @@ class FileApprovalPersistence(ApprovalPersistence):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.requests_file = self.storage_dir / "approval_requests.json"
-        self.history_file = self.storage_dir / "approval_history.json"
+        self.history_file = self.storage_dir / "approval_history.jsonl"
 
         # Initialize files if they don't exist
         self._ensure_files_exist()
 
     def _ensure_files_exist(self) -> None:
-        """Ensure storage files exist."""
+        """Ensure storage files exist, migrating a legacy JSON history."""
         if not self.requests_file.exists():
             self.requests_file.write_text("{}", encoding="utf-8")
         if not self.history_file.exists():
-            self.history_file.write_text("[]", encoding="utf-8")
+            legacy_file = self.storage_dir / "approval_history.json"
+            legacy = self._load_json(legacy_file, [])
+            self.history_file.write_text(
+                "".join(self._to_line(entry) for entry in legacy), encoding="utf-8"
+            )
+            if legacy_file.exists():
+                legacy_file.unlink()
+                logger.info(f"Migrated {len(legacy)} history entries to {self.history_file}")
+
+    @staticmethod
+    def _to_line(entry: Dict[str, Any]) -> str:
+        """Serialize a history entry as one JSON Lines record."""
+        return json.dumps(entry, default=str, ensure_ascii=False) + "\n"
+
+    def _read_history(self) -> List[Dict[str, Any]]:
+        """Read all history entries, skipping lines that fail to parse."""
+        history = []
+        try:
+            with self.history_file.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        history.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping bad line in {self.history_file}: {e}")
+        except FileNotFoundError:
+            return []
+        return history
 
     def _load_json(self, filepath: Path, default: Any = None) -> Any:
         """Load JSON file with error handling.
@@ -177,19 +219,18 @@ class FileApprovalPersistence(ApprovalPersistence):
         if timestamp is None:
             timestamp = datetime.now()
 
-        history = self._load_json(self.history_file, [])
-
-        # Find and update request in requests file
+        # Find request in requests file and append its decision to history
         requests = self._load_json(self.requests_file, {})
         if request_id in requests:
-            history.append({
+            entry = {
                 "request_id": request_id,
                 "decision": decision,
                 "decided_at": timestamp.isoformat(),
                 "tool_name": requests[request_id].get("tool_name"),
                 "prompt": requests[request_id].get("prompt"),
-            })
-            self._save_json(self.history_file, history)
+            }
+            with self.history_file.open("a", encoding="utf-8") as f:
+                f.write(self._to_line(entry))
             logger.debug(f"Saved approval decision: {request_id} -> {decision}")
 
     def load_request(self, request_id: str) -> Optional[Dict[str, Any]]:
@@ -213,7 +254,7 @@ class FileApprovalPersistence(ApprovalPersistence):
         Returns:
             List of approval records
         """
-        history = self._load_json(self.history_file, [])
+        history = self._read_history()
         if limit:
             return history[-limit:]
         return history
@@ -232,9 +273,21 @@ class FileApprovalPersistence(ApprovalPersistence):
 
     def clear_history(self) -> None:
         """Clear all approval history."""
-        self._save_json(self.history_file, [])
+        self.history_file.write_text("", encoding="utf-8")
         logger.info("Cleared approval history")
 
+    def history_fingerprint(self) -> Optional[Tuple[int, int]]:
+        """Return the history file's (mtime_ns, size), or None if it cannot be read.
+
+        Returns:
+            Fingerprint tuple, or None if the file is missing
+        """
+        try:
+            stat = self.history_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def load_decision(self, request_id: str) -> Optional[str]:
         """Load the decision for a specific request.
 
@@ -244,8 +297,7 @@ class FileApprovalPersistence(ApprovalPersistence):
         Returns:
             Decision string ("approved" or "rejected") or None if not found
         """
-        history = self._load_json(self.history_file, [])
-        for entry in history:
+        for entry in self._read_history():
             if entry.get("request_id") == request_id:
                 return entry.get("decision")
         return None
@@ -15,6 +15,16 @@ class HITLTool:
     Requests user approval before executing the wrapped tool.
     """
 
+    __slots__ = (
+        "tool",
+        "approval_manager",
+        "tool_name",
+        "requires_approval",
+        "timeout",
+        "default_action",
+        "prompt_template",
+    )
+
     def __init__(
         self,
         tool: Callable,
@@ -3,8 +3,7 @@
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-import yaml
-
+from simple_agent.core.config_manager import load_yaml_file
 from simple_agent.orchestration.flow_validator import FlowValidator
 from simple_agent.orchestration.orchestrator_agent import OrchestratorAgent
 from simple_agent.orchestration.agent_tool import AgentTool
@@ -50,8 +49,8 @@ class FlowManager:
         if not flow_path.exists():
             raise FileNotFoundError(f"Flow file not found: {flow_path}")
 
-        with open(flow_path, "r") as f:
-            flow_def = yaml.safe_load(f)
+        # Parsed once per file version across all FlowManager instances
+        flow_def = load_yaml_file(flow_path)
 
         # Cache the flow
         self.flows[flow_name] = flow_def
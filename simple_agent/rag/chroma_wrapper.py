@@ -4,9 +4,6 @@ import logging
 from pathlib import Path
 from typing import Any, List, Optional
 
-import chromadb
-import chromadb.config
-
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +19,11 @@ class ChromaWrapper:
         self.collections_dir = collections_dir
         # Create directory if it doesn't exist
         Path(collections_dir).mkdir(parents=True, exist_ok=True)
+        # Imported here so loading simple_agent.rag (e.g. for DocumentLoader)
+        # does not pull in chromadb's heavy import chain until a store is opened
+        import chromadb
+        import chromadb.config
+
         # Turn off telemetry
         client_settings = chromadb.config.Settings(anonymized_telemetry=False)
         # Initialize Chroma persistent client
@@ -22,6 +22,10 @@ class IndexVersionError(ValueError):
 class Collection:
     """A single RAG collection with documents and metadata."""
 
+    # Documents per Chroma add() call; keeps each write (and the embedding
+    # pass Chroma runs over it) bounded and below Chroma's max batch size
+    ADD_BATCH_SIZE = 1024
+
     def __init__(self, name: str, chroma_collection: Any, metadata: dict):
         """Initialize Collection.
 
@@ -63,13 +67,19 @@ class Collection:
         texts = [doc["content"] for doc in documents]
 
         # Filter out None values from metadata (Chroma doesn't accept them)
-        filtered_metadata = []
-        for metadata in metadata_list:
-            filtered = {k: v for k, v in metadata.items() if v is not None}
-            filtered_metadata.append(filtered)
-
-        # Add to Chroma collection
-        self.chroma_collection.add(ids=ids, documents=texts, metadatas=filtered_metadata)
+        filtered_metadata = [
+            {k: v for k, v in metadata.items() if v is not None}
+            for metadata in metadata_list
+        ]
+
+        # Add to Chroma collection in bounded batches
+        for start in range(0, len(ids), self.ADD_BATCH_SIZE):
+            end = start + self.ADD_BATCH_SIZE
+            self.chroma_collection.add(
+                ids=ids[start:end],
+                documents=texts[start:end],
+                metadatas=filtered_metadata[start:end],
+            )
 
         # Update collection document count
         self.metadata["document_count"] = len(documents)
@@ -280,8 +290,10 @@ class Collection:
                 chunks = DocumentLoader.chunk_text(
                     doc["content"], chunk_size=chunk_size, overlap=chunk_overlap
                 )
-                for chunk_idx, chunk in enumerate(chunks):
-                    metadata = DocumentLoader.extract_metadata(doc["source"], chunk_idx)
+                chunk_metadata = DocumentLoader.extract_chunk_metadata(
+                    doc["source"], len(chunks)
+                )
+                for chunk_idx, (chunk, metadata) in enumerate(zip(chunks, chunk_metadata)):
                     all_docs_to_add.append(
                         {
                             "id": f"{metadata['document_name']}_chunk_{chunk_idx}",
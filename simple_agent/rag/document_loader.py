@@ -1,9 +1,11 @@
 """Document loader for loading and chunking files."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 from simple_agent.rag.collection import DocumentValidationError
 
@@ -38,29 +40,64 @@ class DocumentLoader:
             "source": str(path),
         }
 
+    @staticmethod
+    def _iter_supported_files(directory: str) -> Iterator[str]:
+        """Yield supported file paths under directory, depth-first.
+
+        Uses os.scandir so file/dir checks come from the directory entry
+        instead of a stat per path. Symlinked directories are not followed,
+        and directories that cannot be listed are logged and skipped.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            # Log and skip directories that cannot be read
+            logger.warning(f"Failed to read directory {directory}: {e}")
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from DocumentLoader._iter_supported_files(entry.path)
+            elif (
+                entry.is_file()
+                and os.path.splitext(entry.name)[1] in DocumentLoader.SUPPORTED_EXTENSIONS
+            ):
+                yield entry.path
+
+    @staticmethod
+    def _load_file_or_skip(file_path: str) -> Optional[dict]:
+        """Load a file, logging and returning None if it cannot be read."""
+        try:
+            return DocumentLoader.load_file(file_path)
+        except Exception as e:
+            # Log and skip files that fail to load
+            logger.warning(f"Failed to load file {file_path}: {e}")
+            return None
+
     @staticmethod
     def load_directory(directory_path: str) -> List[dict]:
         """Load all supported files from directory recursively.
 
+        Files are read concurrently on a thread pool (file reads release the
+        GIL) and returned in path order.
+
         Args:
             directory_path: Path to directory
 
         Returns:
             List of document dicts
         """
-        documents = []
-        directory = Path(directory_path)
+        if not os.path.isdir(directory_path):
+            return []
 
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix in DocumentLoader.SUPPORTED_EXTENSIONS:
-                try:
-                    doc = DocumentLoader.load_file(str(file_path))
-                    documents.append(doc)
-                except Exception as e:
-                    # Log and skip files that fail to load
-                    logger.warning(f"Failed to load file {file_path}: {e}")
+        file_paths = list(DocumentLoader._iter_supported_files(directory_path))
+        if len(file_paths) <= 1:
+            loaded = [DocumentLoader._load_file_or_skip(p) for p in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+                loaded = list(executor.map(DocumentLoader._load_file_or_skip, file_paths))
 
-        return documents
+        return [doc for doc in loaded if doc is not None]
 
     @staticmethod
     def chunk_text(text: str, chunk_size: int, overlap: int) -> List[str]:
@@ -73,25 +110,22 @@ class DocumentLoader:
 
         Returns:
             List of text chunks
+
+        Raises:
+            ValueError: If overlap is not smaller than chunk_size
         """
         if not text:
             return []
 
-        chunks = []
-        start = 0
-
-        while start < len(text):
-            # Calculate end position
-            end = min(start + chunk_size, len(text))
-            chunk = text[start:end]
-            chunks.append(chunk)
-
-            # Move start position for next chunk (accounting for overlap)
-            # Step forward by (chunk_size - overlap) to create overlap
-            step = chunk_size - overlap
-            start += step
+        # Step forward by (chunk_size - overlap) to create overlap
+        step = chunk_size - overlap
+        if step <= 0:
+            raise ValueError(
+                f"overlap ({overlap}) must be smaller than chunk_size ({chunk_size})"
+            )
 
-        return chunks
+        # One slice per chunk start; the last chunks are clipped at the end
+        return [text[start : start + chunk_size] for start in range(0, len(text), step)]
 
     @staticmethod
     def extract_metadata(file_path: str, chunk_index: int) -> dict:
@@ -104,13 +138,35 @@ class DocumentLoader:
         Returns:
             Dict with metadata
         """
+        return {**DocumentLoader._source_metadata(file_path), "chunk_index": chunk_index}
+
+    @staticmethod
+    def extract_chunk_metadata(file_path: str, chunk_count: int) -> List[dict]:
+        """Extract metadata for every chunk of one document.
+
+        The file is stat'd once and its fields shared by all chunks, instead
+        of once per chunk as with extract_metadata.
+
+        Args:
+            file_path: Path to source file
+            chunk_count: Number of chunks in the document
+
+        Returns:
+            List of metadata dicts, one per chunk index
+        """
+        source = DocumentLoader._source_metadata(file_path)
+        return [{**source, "chunk_index": chunk_index} for chunk_index in range(chunk_count)]
+
+    @staticmethod
+    def _source_metadata(file_path: str) -> dict:
+        """Build the per-file metadata fields (chunk_index left at 0)."""
         path = Path(file_path)
         stat = path.stat()
 
         return {
             "document_name": path.name,
             "source_path": str(path),
-            "chunk_index": chunk_index,
+            "chunk_index": 0,
             "doc_file_timestamp": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat(),
             "page_name": None,
             "page": None,
@@ -14,6 +14,10 @@ class EmbeddingProvider:
         "sentence-transformers/all-mpnet-base-v2",
     }
 
+    # Inputs per embedding request; within the smallest common provider
+    # limit (Cohere: 96, OpenAI: 2048)
+    BATCH_SIZE = 96
+
     @staticmethod
     def get_embeddings(texts: List[str], model: str) -> List[List[float]]:
         """Generate embeddings for multiple texts.
@@ -31,9 +35,12 @@ class EmbeddingProvider:
         if not texts:
             return []
 
-        response = litellm.embedding(model=model, input=texts)
-
-        embeddings = [item["embedding"] for item in response["data"]]
+        # One request per batch rather than per text, in input order
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), EmbeddingProvider.BATCH_SIZE):
+            batch = texts[start : start + EmbeddingProvider.BATCH_SIZE]
+            response = litellm.embedding(model=model, input=batch)
+            embeddings.extend(item["embedding"] for item in response["data"])
         return embeddings
 
     @staticmethod
@@ -1,9 +1,58 @@
 """Token counter utility for estimating text token usage."""
+import functools
 import logging
+import time
+from typing import Optional
+
 import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# After a failed encoding load, count with the fallback for this long before retrying
+ENCODING_RETRY_SECONDS = 60.0
+_last_load_failure: Optional[float] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding() -> tiktoken.Encoding:
+    """
+    Load the cl100k_base encoding once per process.
+
+    Only a successful load is cached. A failure (e.g. the BPE file cannot be
+    downloaded) raises, so the next call tries again.
+
+    Returns:
+        The cl100k_base encoding.
+    """
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _encoding_or_none() -> Optional[tiktoken.Encoding]:
+    """
+    Return the cached encoding, or None while a recent load failure cools down.
+
+    Retrying on every call would repeat the BPE download (a network round-trip)
+    for each count while offline, so a failure is retried at most once per
+    ENCODING_RETRY_SECONDS.
+
+    Returns:
+        The encoding, or None if it is unavailable right now.
+    """
+    global _last_load_failure
+    if (
+        _last_load_failure is not None
+        and time.monotonic() - _last_load_failure < ENCODING_RETRY_SECONDS
+    ):
+        return None
+    try:
+        encoding = _get_encoding()
+    except Exception as e:
+        _last_load_failure = time.monotonic()
+        logger.debug(f"Tiktoken unavailable, using fallback estimation: {e}")
+        return None
+    _last_load_failure = None
+    return encoding
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -21,8 +70,11 @@ def estimate_tokens(text: str) -> int:
     if not text:
         return 0
 
+    encoding = _encoding_or_none()
+    if encoding is None:
+        return _estimate_tokens_fallback(text)
+
     try:
-        encoding = tiktoken.get_encoding("cl100k_base")
         tokens = encoding.encode(text)
         return len(tokens)
     except Exception as e:
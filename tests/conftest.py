@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for all tests.
+"""
+
+# Import the heavy core modules (smolagents, LiteLLM, Jinja2, PyYAML) once at
+# startup, so each process, including every xdist worker, pays for them
+# before collection rather than inside whichever test module imports first
+import simple_agent.agents.simple_agent  # noqa: F401
+import simple_agent.core.agent_manager  # noqa: F401
+import simple_agent.core.config_manager  # noqa: F401
+import simple_agent.core.tool_manager  # noqa: F401
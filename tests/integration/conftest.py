@@ -0,0 +1,112 @@
+"""
+Shared pytest configuration for integration tests.
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+# Make the cli_repl_kit submodule importable once, instead of per test module
+CLI_REPL_KIT_PATH = str(
+    Path(__file__).parent.parent.parent / "simple_agent" / "lib" / "cli_repl_kit"
+)
+if CLI_REPL_KIT_PATH not in sys.path:
+    sys.path.insert(0, CLI_REPL_KIT_PATH)
+
+
+@pytest.fixture(scope="module")
+def vcr_config() -> dict:
+    """pytest-recording settings for any integration module marked vcr.
+
+    Credentials never reach cassettes, and localhost traffic (the mock LLM
+    server below) is passed through rather than recorded.
+    """
+    return {"filter_headers": ["authorization", "api-key"], "ignore_localhost": True}
+
+
+# Canned answers for the local mock LLM: first needle found in the task wins
+MOCK_LLM_ANSWERS = [
+    ("2+2", "4"),
+    ("1+1", "2"),
+    ("3+3", "6"),
+    ("Hello from agent 1", "Hello from agent 1"),
+    ("Hello from agent 2", "Hello from agent 2"),
+    ("capital of France", "Paris"),
+    ("favorite color", "Blue"),
+]
+
+
+class _MockLLMHandler(BaseHTTPRequestHandler):
+    """OpenAI-compatible chat completions endpoint that always calls final_answer."""
+
+    def do_POST(self) -> None:
+        """Answer a chat completion request with a canned final_answer tool call."""
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        user_messages = [
+            m.get("content") for m in request.get("messages", []) if m.get("role") == "user"
+        ]
+        task = json.dumps(user_messages[-1]) if user_messages else ""
+        answer = next(
+            (reply for needle, reply in MOCK_LLM_ANSWERS if needle in task), "OK"
+        )
+
+        body = json.dumps(
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request.get("model", "mock"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "tool_calls",
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [
+                                {
+                                    "id": "call_mock",
+                                    "type": "function",
+                                    "function": {
+                                        "name": "final_answer",
+                                        "arguments": json.dumps({"answer": answer}),
+                                    },
+                                }
+                            ],
+                        },
+                    }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep request logs out of the test output."""
+
+
+@pytest.fixture(scope="session")
+def local_llm_server() -> Iterator[str]:
+    """Serve canned OpenAI chat completions on localhost for the session.
+
+    Yields:
+        Base URL to use as the OpenAI api_base (e.g. http://127.0.0.1:PORT/v1)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockLLMHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
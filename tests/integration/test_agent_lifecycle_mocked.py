@@ -6,36 +6,52 @@ Uses mocked LLM responses for CI/CD compatibility.
 """
 
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from typing import Iterator
+from unittest.mock import DEFAULT, patch, MagicMock
 
 import pytest
 
+from simple_agent.agents import model_factory as _model_factory_mod
+from simple_agent.agents import simple_agent as _simple_agent_mod
 from simple_agent.core.config_manager import ConfigManager
 from simple_agent.core.agent_manager import AgentManager
 
+_CONFIG_PATH = str(
+    (Path(__file__).parent.parent / "data" / "test_config.yaml").resolve()
+)
+
+
+@pytest.fixture(scope="class")
+def empty_agent_manager() -> AgentManager:
+    """AgentManager with no agents; lookups of missing agents don't mutate it."""
+    return AgentManager(ConfigManager.load(_CONFIG_PATH))
+
 
 class TestAgentLifecycleMocked:
     """Test full agent lifecycle with mocked LLM."""
 
     @pytest.fixture
     def test_config(self) -> dict:
-        """Load test configuration."""
-        config_path = Path(__file__).parent.parent / "data" / "test_config.yaml"
-        config = ConfigManager.load(str(config_path))
-        return config
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_full_lifecycle_default_agent(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+        """Fresh copy of the test configuration (ConfigManager.load caches the parse)."""
+        return ConfigManager.load(_CONFIG_PATH)
+
+    @pytest.fixture(autouse=True)
+    def _patched(self) -> Iterator[None]:
+        """Patch LiteLLMModel and ToolCallingAgent for every test in the class."""
+        with patch.multiple(
+            _model_factory_mod, LiteLLMModel=DEFAULT
+        ) as factory_mocks, patch.multiple(
+            _simple_agent_mod, ToolCallingAgent=DEFAULT
+        ) as agent_mocks:
+            self.mocks = {**factory_mocks, **agent_mocks}
+            yield
+
+    def test_full_lifecycle_default_agent(self, test_config: dict) -> None:
         """Test creating and running agent with default configuration."""
+        mock_tool_calling_agent = self.mocks["ToolCallingAgent"]
+
         # Setup mock agent response
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.return_value = "The answer is 4"
+        mock_agent_instance = MagicMock(**{"run.return_value": "The answer is 4"})
         mock_tool_calling_agent.return_value = mock_agent_instance
 
         # Initialize AgentManager
@@ -56,22 +72,25 @@ class TestAgentLifecycleMocked:
         assert str(response) == "The answer is 4"
         mock_agent_instance.run.assert_called_once_with("What is 2+2?", reset=True)
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
+    @pytest.mark.parametrize(
+        ("auto_load_default", "expected_count"),
+        [(False, 3), (True, 4)],
+        ids=["manual_only", "with_config_agents"],
+    )
     def test_multiple_agents(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
+        self, test_config: dict, auto_load_default: bool, expected_count: int
     ) -> None:
-        """Test managing multiple agents."""
+        """Test managing multiple agents, with and without config auto-loading."""
+        mock_tool_calling_agent = self.mocks["ToolCallingAgent"]
+
         # Setup mocks
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.return_value = "Response"
+        mock_agent_instance = MagicMock(**{"run.return_value": "Response"})
         mock_tool_calling_agent.return_value = mock_agent_instance
 
-        # Initialize AgentManager
+        # Initialize AgentManager (config agents are only created on request)
         agent_manager = AgentManager(test_config)
+        if auto_load_default:
+            agent_manager._load_agents_from_config()
 
         # Create multiple agents
         agent1 = agent_manager.create_agent("agent1")
@@ -80,27 +99,21 @@ class TestAgentLifecycleMocked:
 
         # Verify all registered
         agents = agent_manager.list_agents()
-        assert (
-            len(agents) == 3
-        )  # Only manually created agents (not auto-loaded from config)
+        assert len(agents) == expected_count
         assert "agent1" in agents
         assert "agent2" in agents
         assert "agent3" in agents
+        assert ("default" in agents) is auto_load_default
 
         # Verify can retrieve each
         assert agent_manager.get_agent("agent1") == agent1
         assert agent_manager.get_agent("agent2") == agent2
         assert agent_manager.get_agent("agent3") == agent3
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_config_loading_and_defaults(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    def test_config_loading_and_defaults(self, test_config: dict) -> None:
         """Test that configuration loads correctly and defaults are applied."""
+        mock_tool_calling_agent = self.mocks["ToolCallingAgent"]
+
         # Setup mocks
         mock_agent_instance = MagicMock()
         mock_tool_calling_agent.return_value = mock_agent_instance
@@ -113,7 +126,6 @@ class TestAgentLifecycleMocked:
 
         # Verify defaults were applied from config
         # Note: call_args gets the LAST call, which is for 'default_agent'
-        # The first call was for auto-loaded 'default' agent
         call_kwargs = mock_tool_calling_agent.call_args.kwargs
         assert (
             call_kwargs["instructions"] == "You are a test assistant."
@@ -121,30 +133,27 @@ class TestAgentLifecycleMocked:
         # ToolCallingAgent doesn't have verbosity_level parameter
         assert call_kwargs["max_steps"] == 10
 
-    def test_error_handling_nonexistent_agent(self, test_config: dict) -> None:
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            lambda manager: manager.get_agent("missing"),
+            lambda manager: manager.run_agent("missing", "test"),
+        ],
+        ids=["get_agent", "run_agent"],
+    )
+    def test_error_handling_nonexistent_agent(
+        self, empty_agent_manager: AgentManager, operation
+    ) -> None:
         """Test error handling when accessing non-existent agent."""
-        agent_manager = AgentManager(test_config)
-
-        # Try to get non-existent agent
         with pytest.raises(KeyError, match="Agent 'missing' not loaded"):
-            agent_manager.get_agent("missing")
+            operation(empty_agent_manager)
 
-        # Try to run non-existent agent
-        with pytest.raises(KeyError, match="Agent 'missing' not loaded"):
-            agent_manager.run_agent("missing", "test")
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_user_prompt_template_integration(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    def test_user_prompt_template_integration(self, test_config: dict) -> None:
         """Test user_prompt_template end-to-end (create, run, save, load)."""
+        mock_tool_calling_agent = self.mocks["ToolCallingAgent"]
+
         # Setup mock agent response
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.return_value = "The answer is 4"
+        mock_agent_instance = MagicMock(**{"run.return_value": "The answer is 4"})
         mock_tool_calling_agent.return_value = mock_agent_instance
 
         # Initialize AgentManager
@@ -20,9 +20,7 @@ def test_app_imports_successfully():
 
 def test_cli_repl_kit_imports_successfully():
     """Test that cli_repl_kit imports correctly from submodule."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "simple_agent" / "lib" / "cli_repl_kit"))
-
+    # Submodule path is added to sys.path by tests/integration/conftest.py
     try:
         from cli_repl_kit import REPL, CommandPlugin
         assert REPL is not None
@@ -5,30 +5,46 @@ Tests that group commands (like /agent) correctly show subcommands
 when executed without a subcommand argument.
 """
 
+import re
+
 import pytest
-import sys
 from pathlib import Path
 from unittest.mock import Mock
 
-# Add cli_repl_kit to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "simple_agent" / "lib" / "cli_repl_kit"))
-
 import click
 from cli_repl_kit.core.config import Config
 from cli_repl_kit.core.command_executor import CommandExecutor
 from cli_repl_kit.core.formatting import formatted_text_to_ansi_string
 from cli_repl_kit.plugins.base import ValidationResult
 
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+def _clean_output(output_lines: list) -> str:
+    """Join captured output lines and strip ANSI codes for easier assertion."""
+    return _ANSI_RE.sub('', "\n".join(output_lines))
+
+
+@pytest.fixture(scope="session")
+def config() -> Config:
+    """Load REPL config once per session."""
+    config_path = Path(__file__).parent.parent.parent / "simple_agent" / "repl_config.yaml"
+    return Config.load(str(config_path), app_name="simple-agent")
+
+
+@pytest.fixture(scope="session")
+def cli_with_actual_agent() -> click.Group:
+    """Create CLI with actual agent command (imported once per session)."""
+    from simple_agent.commands.agent_commands import agent
+
+    cli = click.Group()
+    cli.add_command(agent, name="agent")
+    return cli
+
 
 class TestGroupCommandExecution:
     """Test execution of group commands without subcommands."""
 
-    @pytest.fixture
-    def config(self) -> Config:
-        """Load REPL config."""
-        config_path = Path(__file__).parent.parent.parent / "simple_agent" / "repl_config.yaml"
-        return Config.load(str(config_path), app_name="simple-agent")
-
     @pytest.fixture
     def cli_with_agent(self) -> click.Group:
         """Create CLI with agent group command."""
@@ -109,32 +125,26 @@ class TestGroupCommandExecution:
         # Execute /agent
         executor.execute_command("/agent", mock_buffer, False, mock_event)
 
-        # Clean ANSI codes for easier assertion
-        def clean(text: str) -> str:
-            import re
-            return re.sub(r'\x1b\[[0-9;]*m', '', text)
-
-        clean_output = [clean(line) for line in output_lines]
-        full_output = "\n".join(clean_output)
+        full_output = _clean_output(output_lines)
 
         # Should show the command formatted
-        assert any("/agent" in line for line in clean_output), \
+        assert "/agent" in full_output, \
             f"Command display not found in output: {full_output}"
 
         # Should show group description
-        assert any("Agent management commands" in line for line in clean_output), \
+        assert "Agent management commands" in full_output, \
             f"Group description not found in output: {full_output}"
 
         # Should show "Available subcommands" header
-        assert any("Available subcommands" in line for line in clean_output), \
+        assert "Available subcommands" in full_output, \
             f"Subcommands header not found in output: {full_output}"
 
         # Should list the subcommands
-        assert any("list" in line for line in clean_output), \
+        assert "list" in full_output, \
             f"'list' subcommand not found in output: {full_output}"
-        assert any("create" in line for line in clean_output), \
+        assert "create" in full_output, \
             f"'create' subcommand not found in output: {full_output}"
-        assert any("load" in line for line in clean_output), \
+        assert "load" in full_output, \
             f"'load' subcommand not found in output: {full_output}"
 
     def test_group_command_with_subcommand_executes(
@@ -148,41 +158,20 @@ class TestGroupCommandExecution:
         # Execute /agent list
         executor.execute_command("/agent list", mock_buffer, False, mock_event)
 
-        # Clean ANSI codes
-        def clean(text: str) -> str:
-            import re
-            return re.sub(r'\x1b\[[0-9;]*m', '', text)
-
-        clean_output = [clean(line) for line in output_lines]
-        full_output = "\n".join(clean_output)
+        full_output = _clean_output(output_lines)
 
         # Should show the command formatted
-        assert any("agent" in line for line in clean_output), \
+        assert "agent" in full_output, \
             f"Command display not found in output: {full_output}"
 
         # Should show output from list command
-        assert any("Agent list" in line for line in clean_output), \
+        assert "Agent list" in full_output, \
             f"List command output not found in output: {full_output}"
 
 
 class TestGroupCommandWithActualCommands:
     """Test with actual simple_agent commands."""
 
-    @pytest.fixture
-    def config(self) -> Config:
-        """Load REPL config."""
-        config_path = Path(__file__).parent.parent.parent / "simple_agent" / "repl_config.yaml"
-        return Config.load(str(config_path), app_name="simple-agent")
-
-    @pytest.fixture
-    def cli_with_actual_agent(self) -> click.Group:
-        """Create CLI with actual agent command."""
-        from simple_agent.commands.agent_commands import agent
-
-        cli = click.Group()
-        cli.add_command(agent, name="agent")
-        return cli
-
     @pytest.fixture
     def output_lines(self) -> list:
         """Capture output lines."""
@@ -236,20 +225,14 @@ class TestGroupCommandWithActualCommands:
         # Execute /agent
         executor.execute_command("/agent", mock_buffer, False, mock_event)
 
-        # Clean ANSI codes
-        def clean(text: str) -> str:
-            import re
-            return re.sub(r'\x1b\[[0-9;]*m', '', text)
-
-        clean_output = [clean(line) for line in output_lines]
-        full_output = "\n".join(clean_output)
+        full_output = _clean_output(output_lines)
 
         # Should show "Available subcommands" header
-        assert any("Available subcommands" in line for line in clean_output), \
+        assert "Available subcommands" in full_output, \
             f"Subcommands header not found in output:\n{full_output}"
 
         # Should list actual agent subcommands
         expected_subcommands = ["list", "create", "load", "run", "chat", "tools"]
         for subcmd in expected_subcommands:
-            assert any(subcmd in line for line in clean_output), \
+            assert subcmd in full_output, \
                 f"'{subcmd}' subcommand not found in output:\n{full_output}"
@@ -7,6 +7,7 @@ Tests the direct LLM command that bypasses agent wrapper.
 import click
 import pytest
 from click.testing import CliRunner
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch
 
 from simple_agent.commands.llm import llm_command
@@ -22,11 +23,30 @@ def cli(ctx):
 
 cli.add_command(llm_command, name="llm")
 
+# The command prints through its own module console; ctx.obj only needs the key
+_NULL_CONSOLE = SimpleNamespace(print=lambda *args, **kwargs: None)
 
-@pytest.fixture
-def mock_config():
-    """Mock configuration with llm providers."""
-    return {
+
+def _call_llm(mock_config, provider, *prompt):
+    """Invoke the /llm callback directly, skipping Click's argv parsing.
+
+    Parser behaviour is covered by the CliRunner tests below.
+    """
+    ctx = click.Context(llm_command, obj={"config": mock_config, "console": _NULL_CONSOLE})
+    with ctx:
+        llm_command.callback(provider=provider, prompt_file=None, prompt=prompt)
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+# Mock configuration with llm providers, shared read-only by every test
+FROZEN_CONFIG = _freeze(
+    {
         "llm": {
             "openai": {
                 "model": "gpt-4o-mini",
@@ -51,211 +71,140 @@ def mock_config():
             },
         }
     }
+)
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Mock configuration with llm providers (immutable, shared)."""
+    return FROZEN_CONFIG
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Click test runner."""
+    """Click test runner shared by this module.
+
+    CliRunner holds no state between invokes; each invoke builds its own
+    streams and Result. Module scope is also per-worker under pytest-xdist.
+    """
     return CliRunner()
 
 
-def test_llm_command_with_openai_provider(runner, mock_config):
-    """Test /llm command with OpenAI provider."""
-    with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get, \
-         patch("simple_agent.commands.llm.LiteLLMModel") as mock_model_class:
-        
-        # Mock config retrieval
-        def get_side_effect(config, path, default=None):
-            if path == "llm.openai":
-                return mock_config["llm"]["openai"]
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        
-        # Mock LiteLLM model - return Mock with content attribute
-        mock_model_instance = Mock()
-        mock_response = Mock()
-        mock_response.content = "The answer is 4"
-        mock_model_instance.return_value = mock_response
-        mock_model_class.return_value = mock_model_instance
-        
-        # Run command
-        result = runner.invoke(
-            cli,
-            ["llm", "openai", "What", "is", "2+2?"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify success
-        assert result.exit_code == 0
-        assert "The answer is 4" in result.output
-        
-        # Verify model was called with correct prompt in messages format
-        mock_model_instance.assert_called_once_with([{"role": "user", "content": "What is 2+2?"}])
-        
-        # Verify model was created with correct config
-        mock_model_class.assert_called_once()
-        call_kwargs = mock_model_class.call_args.kwargs
-        assert call_kwargs["model_id"] == "gpt-4o-mini"
-        assert call_kwargs["api_key"] == "test-api-key"
-        assert call_kwargs["temperature"] == 0.7
-        assert call_kwargs["max_tokens"] == 2000
-
-
-def test_llm_command_with_azure_provider(runner, mock_config):
-    """Test /llm command with Azure OpenAI provider using API key."""
-    with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get, \
-         patch("simple_agent.commands.llm.LiteLLMModel") as mock_model_class, \
-         patch("simple_agent.commands.llm.ConfigManager.resolve_env_var") as mock_resolve:
-        
-        # Mock config retrieval
-        def get_side_effect(config, path, default=None):
-            if path == "llm.azure_openai":
-                return mock_config["llm"]["azure_openai"]
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        mock_resolve.side_effect = lambda x: x  # Return value as-is
-        
-        # Mock LiteLLM model
-        mock_model_instance = Mock()
-        mock_response = Mock(); mock_response.content = "Azure response"; mock_model_instance.return_value = mock_response
-        mock_model_class.return_value = mock_model_instance
-        
-        # Run command
-        result = runner.invoke(
-            cli,
-            ["llm", "azure_openai", "Test", "prompt"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify success
-        assert result.exit_code == 0
-        assert "Azure response" in result.output
-        
-        # Verify model was created with Azure config
-        mock_model_class.assert_called_once()
-        call_kwargs = mock_model_class.call_args.kwargs
-        assert call_kwargs["model_id"] == "azure/gpt-4o-mini"
-        assert call_kwargs["api_base"] == "https://test.openai.azure.com/"
-        assert call_kwargs["api_version"] == "2024-02-01"
-        assert call_kwargs["api_key"] == "test-azure-key"
-
-
-def test_llm_command_with_ollama_provider(runner, mock_config):
-    """Test /llm command with Ollama (local) provider."""
+@pytest.fixture(scope="session")
+def config_lookup(mock_config):
+    """ConfigManager.get stand-in backed by a dotted-path table built once."""
+    table = {f"llm.{name}": section for name, section in mock_config["llm"].items()}
+    return lambda config, path, default=None: table.get(path, default)
+
+
+@pytest.fixture(autouse=True)
+def llm_mocks(config_lookup):
+    """Patch config lookup, env resolution and LiteLLMModel for every test.
+
+    ConfigManager.get serves provider sections from mock_config, and
+    resolve_env_var returns values unchanged.
+    """
     with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get, \
          patch("simple_agent.commands.llm.LiteLLMModel") as mock_model_class, \
-         patch("simple_agent.commands.llm.ConfigManager.resolve_env_var") as mock_resolve:
-        
-        # Mock config retrieval
-        def get_side_effect(config, path, default=None):
-            if path == "llm.ollama":
-                return mock_config["llm"]["ollama"]
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        mock_resolve.side_effect = lambda x: x
-        
-        # Mock LiteLLM model
-        mock_model_instance = Mock()
-        mock_response = Mock(); mock_response.content = "Ollama response"; mock_model_instance.return_value = mock_response
-        mock_model_class.return_value = mock_model_instance
-        
-        # Run command
-        result = runner.invoke(
-            cli,
-            ["llm", "ollama", "Local", "test"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify success
-        assert result.exit_code == 0
-        assert "Ollama response" in result.output
-        
-        # Verify model was created with Ollama config
-        mock_model_class.assert_called_once()
-        call_kwargs = mock_model_class.call_args.kwargs
-        assert call_kwargs["model_id"] == "ollama/llama3.2:1b"
-        assert call_kwargs["api_base"] == "http://localhost:11434"
-
-
-def test_llm_command_with_invalid_provider(runner, mock_config):
+         patch(
+             "simple_agent.commands.llm.ConfigManager.resolve_env_var",
+             side_effect=lambda x: x,
+         ) as mock_resolve:
+        mock_get.side_effect = config_lookup
+        yield SimpleNamespace(get=mock_get, model=mock_model_class, resolve=mock_resolve)
+
+
+@pytest.mark.parametrize(
+    ("provider", "expected"),
+    [
+        (
+            "openai",
+            {
+                "model_id": "gpt-4o-mini",
+                "api_key": "test-api-key",
+                "temperature": 0.7,
+                "max_tokens": 2000,
+            },
+        ),
+        (
+            "azure_openai",
+            {
+                "model_id": "azure/gpt-4o-mini",
+                "api_base": "https://test.openai.azure.com/",
+                "api_version": "2024-02-01",
+                "api_key": "test-azure-key",
+            },
+        ),
+        (
+            "ollama",
+            {
+                "model_id": "ollama/llama3.2:1b",
+                "api_base": "http://localhost:11434",
+            },
+        ),
+    ],
+    ids=["openai", "azure_openai", "ollama"],
+)
+def test_llm_command_providers(mock_config, llm_mocks, capsys, provider, expected):
+    """Test /llm command builds the right LiteLLM model for each provider."""
+    # Mock LiteLLM model - the command only reads .content from the response
+    mock_model_instance = Mock(
+        return_value=SimpleNamespace(content=f"{provider} response")
+    )
+    llm_mocks.model.return_value = mock_model_instance
+
+    # Run command
+    _call_llm(mock_config, provider, "What", "is", "2+2?")
+
+    # Verify success
+    assert f"{provider} response" in capsys.readouterr().out
+
+    # Verify model was called with correct prompt in messages format
+    mock_model_instance.assert_called_once_with([{"role": "user", "content": "What is 2+2?"}])
+
+    # Verify model was created with the provider's config
+    llm_mocks.model.assert_called_once()
+    assert expected.items() <= llm_mocks.model.call_args.kwargs.items()
+
+
+def test_llm_command_with_invalid_provider(mock_config, capsys):
     """Test /llm command with non-existent provider."""
-    with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get:
-        
-        # Mock config retrieval - return None for invalid provider
-        def get_side_effect(config, path, default=None):
-            if path == "llm.nonexistent":
-                return None
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        
-        # Run command
-        result = runner.invoke(
-            cli,
-            ["llm", "nonexistent", "Test", "prompt"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify error handling
-        assert result.exit_code == 0  # Command doesn't raise, just prints error
-        assert "not found" in result.output.lower()
-
-
-def test_llm_command_with_missing_config(runner, mock_config):
+    # Provider is absent from mock_config, so the lookup returns None
+    _call_llm(mock_config, "nonexistent", "Test", "prompt")  # Prints, doesn't raise
+
+    # Verify error handling
+    assert "not found" in capsys.readouterr().out.lower()
+
+
+def test_llm_command_with_missing_config(mock_config, llm_mocks, capsys):
     """Test /llm command when provider config is missing required fields."""
-    with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get:
-        
-        # Mock config retrieval - return config without 'model' key
-        def get_side_effect(config, path, default=None):
-            if path == "llm.openai":
-                return {"api_key": "test-key"}  # Missing 'model' key
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        
-        # Run command
-        result = runner.invoke(
-            cli,
-            ["llm", "openai", "Test"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify error is caught and displayed
-        assert result.exit_code == 0  # Doesn't crash
-        assert "error" in result.output.lower() or "Error" in result.output
-
-
-def test_llm_command_multi_word_prompt(runner, mock_config):
+    # Mock config retrieval - return config without 'model' key
+    llm_mocks.get.side_effect = None
+    llm_mocks.get.return_value = {"api_key": "test-key"}
+
+    # Run command - the error is caught and displayed, not raised
+    _call_llm(mock_config, "openai", "Test")
+
+    # Verify error is displayed
+    assert "error" in capsys.readouterr().out.lower()
+
+
+def test_llm_command_multi_word_prompt(runner, mock_config, llm_mocks):
     """Test /llm command handles multi-word prompts correctly."""
-    with patch("simple_agent.commands.llm.ConfigManager.get") as mock_get, \
-         patch("simple_agent.commands.llm.LiteLLMModel") as mock_model_class:
-        
-        # Mock config retrieval
-        def get_side_effect(config, path, default=None):
-            if path == "llm.openai":
-                return mock_config["llm"]["openai"]
-            return default
-        
-        mock_get.side_effect = get_side_effect
-        
-        # Mock LiteLLM model
-        mock_model_instance = Mock()
-        mock_response = Mock(); mock_response.content = "Response"; mock_model_instance.return_value = mock_response
-        mock_model_class.return_value = mock_model_instance
-        
-        # Run command with multi-word prompt
-        result = runner.invoke(
-            cli,
-            ["llm", "openai", "This", "is", "a", "long", "prompt", "with", "many", "words"],
-            obj={"config": mock_config, "console": Mock()}
-        )
-        
-        # Verify prompt was joined correctly
-        mock_model_instance.assert_called_once_with([{"role": "user", "content": "This is a long prompt with many words"}])
-        assert result.exit_code == 0
+    # Mock LiteLLM model
+    mock_model_instance = Mock(return_value=SimpleNamespace(content="Response"))
+    llm_mocks.model.return_value = mock_model_instance
+
+    # Run command with multi-word prompt
+    result = runner.invoke(
+        cli,
+        ["llm", "openai", "This", "is", "a", "long", "prompt", "with", "many", "words"],
+        obj={"config": mock_config, "console": _NULL_CONSOLE}
+    )
+
+    # Verify prompt was joined correctly
+    mock_model_instance.assert_called_once_with([{"role": "user", "content": "This is a long prompt with many words"}])
+    assert result.exit_code == 0
 
 
 def test_llm_command_no_prompt(runner, mock_config):
@@ -263,7 +212,7 @@ def test_llm_command_no_prompt(runner, mock_config):
     result = runner.invoke(
         cli,
         ["llm", "openai"],  # No prompt args
-        obj={"config": mock_config, "console": Mock()}
+        obj={"config": mock_config, "console": _NULL_CONSOLE}
     )
 
     # Command exits gracefully with error message (not exception)
@@ -6,6 +6,7 @@ Uses mocked LLM responses for reliable testing.
 """
 
 from pathlib import Path
+from typing import Iterator, List, Tuple
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,41 +14,68 @@ import pytest
 from simple_agent.core.config_manager import ConfigManager
 from simple_agent.core.agent_manager import AgentManager
 
+_CONFIG_PATH = str(
+    (Path(__file__).parent.parent / "data" / "test_config.yaml").resolve()
+)
+
+
+@pytest.fixture(scope="session")
+def test_config() -> dict:
+    """Load test configuration once per session (treat as read-only)."""
+    return ConfigManager.load(_CONFIG_PATH)
+
+
+@pytest.fixture(scope="class")
+def mock_agent() -> Iterator[MagicMock]:
+    """Patch LiteLLMModel and ToolCallingAgent for the class; yield the agent double."""
+    with patch("simple_agent.agents.model_factory.LiteLLMModel"), patch(
+        "simple_agent.agents.simple_agent.ToolCallingAgent"
+    ) as mock_tool_calling_agent:
+        mock_tool_calling_agent.return_value = MagicMock()
+        yield mock_tool_calling_agent.return_value
+
+
+@pytest.fixture(scope="class")
+def agent_manager(test_config: dict, mock_agent: MagicMock) -> AgentManager:
+    """AgentManager with every agent the class uses created once."""
+    manager = AgentManager(test_config)
+    for name in ("test_agent", "agent1", "agent2", "default"):
+        manager.create_agent(name)
+    return manager
+
+
+def _assert_tracking(
+    agent_manager: AgentManager, agent_name: str, prompt: str, response: str
+) -> None:
+    """Assert the manager tracked the given agent, prompt and response."""
+    assert agent_manager.last_agent == agent_name
+    assert agent_manager.last_prompt == prompt
+    assert agent_manager.last_response == response
+
 
 class TestPhase1_1InspectionMocked:
     """Test inspection features with mocked LLM."""
 
-    @pytest.fixture
-    def test_config(self) -> dict:
-        """Load test configuration."""
-        config_path = Path(__file__).parent.parent / "data" / "test_config.yaml"
-        config = ConfigManager.load(str(config_path))
-        return config
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_prompt_response_tracking_lifecycle(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    @pytest.fixture(autouse=True)
+    def _reset(self, agent_manager: AgentManager, mock_agent: MagicMock) -> None:
+        """Clear tracking and canned responses left by the previous test."""
+        mock_agent.reset_mock(return_value=True, side_effect=True)
+        agent_manager.last_prompt = None
+        agent_manager.last_response = None
+        agent_manager.last_agent = None
+        self.mock_agent = mock_agent
+
+    def test_prompt_response_tracking_lifecycle(self, agent_manager: AgentManager) -> None:
         """Test full lifecycle: create agent - run - track prompt/response."""
         # Setup mock agent response
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.return_value = "The capital of France is Paris"
-        mock_tool_calling_agent.return_value = mock_agent_instance
-
-        # Initialize AgentManager
-        agent_manager = AgentManager(test_config)
+        self.mock_agent.run.return_value = "The capital of France is Paris"
 
         # Verify tracking starts as None
         assert agent_manager.last_prompt is None
         assert agent_manager.last_response is None
         assert agent_manager.last_agent is None
 
-        # Create and run agent
-        agent_manager.create_agent("test_agent")
+        # Run the pre-created agent
         prompt = "What is the capital of France?"
         response = agent_manager.run_agent("test_agent", prompt)
 
@@ -59,101 +87,40 @@ class TestPhase1_1InspectionMocked:
             str(response) == "The capital of France is Paris"
         )  # AgentResult supports string conversion
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_tracking_updates_on_multiple_runs(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
-        """Test that tracking updates correctly on subsequent runs."""
-        # Setup mock with multiple responses
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.side_effect = ["Response 1", "Response 2", "Response 3"]
-        mock_tool_calling_agent.return_value = mock_agent_instance
-
-        agent_manager = AgentManager(test_config)
-        agent_manager.create_agent("agent1")
-
-        # First run
-        agent_manager.run_agent("agent1", "Prompt 1")
-        assert agent_manager.last_prompt == "Prompt 1"
-        assert agent_manager.last_response == "Response 1"
-        assert agent_manager.last_agent == "agent1"
-
-        # Second run
-        agent_manager.run_agent("agent1", "Prompt 2")
-        assert agent_manager.last_prompt == "Prompt 2"
-        assert agent_manager.last_response == "Response 2"
-        assert agent_manager.last_agent == "agent1"
-
-        # Third run
-        agent_manager.run_agent("agent1", "Prompt 3")
-        assert agent_manager.last_prompt == "Prompt 3"
-        assert agent_manager.last_response == "Response 3"
-        assert agent_manager.last_agent == "agent1"
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_tracking_across_multiple_agents(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
-        """Test that tracking works when switching between agents."""
-        # Setup mock
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.side_effect = [
-            "Response from agent1",
-            "Response from agent2",
-            "Another from agent1",
-        ]
-        mock_tool_calling_agent.return_value = mock_agent_instance
-
-        agent_manager = AgentManager(test_config)
-        agent_manager.create_agent("agent1")
-        agent_manager.create_agent("agent2")
-
-        # Run with agent1
-        agent_manager.run_agent("agent1", "Prompt for agent1")
-        assert agent_manager.last_agent == "agent1"
-        assert agent_manager.last_prompt == "Prompt for agent1"
-        assert agent_manager.last_response == "Response from agent1"
-
-        # Run with agent2
-        agent_manager.run_agent("agent2", "Prompt for agent2")
-        assert agent_manager.last_agent == "agent2"
-        assert agent_manager.last_prompt == "Prompt for agent2"
-        assert agent_manager.last_response == "Response from agent2"
-
-        # Run with agent1 again
-        agent_manager.run_agent("agent1", "Another prompt for agent1")
-        assert agent_manager.last_agent == "agent1"
-        assert agent_manager.last_prompt == "Another prompt for agent1"
-        assert agent_manager.last_response == "Another from agent1"
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_tracking_handles_non_string_responses(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
+    @pytest.mark.parametrize(
+        "cases",
+        [
+            [
+                ("agent1", "Prompt 1", "Response 1"),
+                ("agent1", "Prompt 2", "Response 2"),
+                ("agent1", "Prompt 3", "Response 3"),
+            ],
+            [
+                ("agent1", "Prompt for agent1", "Response from agent1"),
+                ("agent2", "Prompt for agent2", "Response from agent2"),
+                ("agent1", "Another prompt for agent1", "Another from agent1"),
+            ],
+        ],
+        ids=["multiple_runs", "switching_agents"],
+    )
+    def test_tracking_updates_each_run(
+        self, agent_manager: AgentManager, cases: List[Tuple[str, str, str]]
     ) -> None:
+        """Test that tracking follows each run, on one agent or across agents."""
+        self.mock_agent.run.side_effect = [response for _, _, response in cases]
+
+        for agent_name, prompt, response in cases:
+            agent_manager.run_agent(agent_name, prompt)
+            _assert_tracking(agent_manager, agent_name, prompt, response)
+
+    def test_tracking_handles_non_string_responses(self, agent_manager: AgentManager) -> None:
         """Test that non-string responses are converted to strings."""
         # Setup mock with various response types
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.side_effect = [
+        self.mock_agent.run.side_effect = [
             42,  # Integer
             {"key": "value"},  # Dict
             ["item1", "item2"],  # List
         ]
-        mock_tool_calling_agent.return_value = mock_agent_instance
-
-        agent_manager = AgentManager(test_config)
-        agent_manager.create_agent("test_agent")
 
         # Test integer response
         agent_manager.run_agent("test_agent", "What is 42?")
@@ -170,25 +137,12 @@ class TestPhase1_1InspectionMocked:
         assert "item1" in agent_manager.last_response
         assert isinstance(agent_manager.last_response, str)
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_auto_loaded_agent_tracking(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    def test_auto_loaded_agent_tracking(self, agent_manager: AgentManager) -> None:
         """Test that tracking works with manually created agents."""
         # Setup mock
-        mock_agent_instance = MagicMock()
-        mock_agent_instance.run.return_value = "Auto-loaded response"
-        mock_tool_calling_agent.return_value = mock_agent_instance
-
-        # AgentManager needs agents to be created manually
-        agent_manager = AgentManager(test_config)
-        agent_manager.create_agent("default")
+        self.mock_agent.run.return_value = "Auto-loaded response"
 
-        # Verify 'default' was created
+        # Verify 'default' was created by the agent_manager fixture
         assert "default" in agent_manager.list_agents()
 
         # Run with created agent
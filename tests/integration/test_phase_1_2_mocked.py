@@ -7,51 +7,71 @@ Uses mocked LLM responses for reliable testing.
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Iterator, List, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
+from click.testing import CliRunner
 
+from simple_agent.commands.history_commands import history
 from simple_agent.core.config_manager import ConfigManager
 from simple_agent.core.agent_manager import AgentManager
 
+_CONFIG_PATH = str(
+    (Path(__file__).parent.parent / "data" / "test_config.yaml").resolve()
+)
+
+
+@pytest.fixture(scope="session")
+def test_config() -> dict:
+    """Load test configuration once per session (treat as read-only)."""
+    return ConfigManager.load(_CONFIG_PATH)
+
+
+@pytest.fixture(scope="class")
+def manager_factory(test_config: dict) -> Callable[[], AgentManager]:
+    """Return a builder for fresh AgentManagers over the shared test config."""
+    return lambda: AgentManager(test_config)
+
+
+def _memory(steps: Optional[List[dict]] = None) -> SimpleNamespace:
+    """Lightweight stand-in for SmolAgents memory backed by a plain list.
+
+    get_full_steps returns the live list (no copy); tests only read it.
+    """
+    steps = [] if steps is None else steps
+    return SimpleNamespace(
+        steps=steps,
+        get_full_steps=lambda: steps,
+        reset=steps.clear,
+    )
+
 
 class TestPhase1_2HistoryMocked:
     """Test history and memory features with mocked LLM."""
 
-    @pytest.fixture
-    def test_config(self) -> dict:
-        """Load test configuration."""
-        config_path = Path(__file__).parent.parent / "data" / "test_config.yaml"
-        config = ConfigManager.load(str(config_path))
-        return config
-
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_memory_persists_across_runs(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    @pytest.fixture(autouse=True)
+    def _mock_llm(self) -> Iterator[None]:
+        """Patch LiteLLMModel and ToolCallingAgent for every test in the class."""
+        with patch("simple_agent.agents.model_factory.LiteLLMModel") as mock_litellm, \
+             patch("simple_agent.agents.simple_agent.ToolCallingAgent") as mock_tca:
+            self.mock_litellm, self.mock_tca = mock_litellm, mock_tca
+            yield
+
+    def test_memory_persists_across_runs(self, manager_factory) -> None:
         """Test that SmolAgents memory persists across multiple .run() calls."""
         # Setup mock agent with memory tracking
         mock_agent_instance = MagicMock()
         mock_agent_instance.run.side_effect = ["Response 1", "Response 2", "Response 3"]
 
         # Mock memory steps - SmolAgents adds steps automatically
-        mock_memory = MagicMock()
-        mock_memory.steps = []
-
-        def mock_get_full_steps():
-            """Simulate SmolAgents memory accumulation."""
-            return mock_memory.steps.copy()
-
-        mock_memory.get_full_steps = mock_get_full_steps
+        mock_memory = _memory()
         mock_agent_instance.memory = mock_memory
-        mock_tool_calling_agent.return_value = mock_agent_instance
+        self.mock_tca.return_value = mock_agent_instance
 
         # Initialize AgentManager and create agent
-        agent_manager = AgentManager(test_config)
+        agent_manager = manager_factory()
         agent_manager.create_agent("test_agent")
         agent_wrapper = agent_manager.get_agent("test_agent")
 
@@ -87,18 +107,10 @@ class TestPhase1_2HistoryMocked:
         assert memory_steps[0]["type"] == "task"
         assert memory_steps[1]["type"] == "action"
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_history_retrieval_from_smolagents_memory(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    def test_history_retrieval_from_smolagents_memory(self, manager_factory) -> None:
         """Test retrieving history from SmolAgents memory via get_full_steps()."""
         # Setup mock agent with pre-populated memory
         mock_agent_instance = MagicMock()
-        mock_memory = MagicMock()
 
         # Simulate SmolAgents memory with conversation history
         memory_steps = [
@@ -125,12 +137,11 @@ class TestPhase1_2HistoryMocked:
                 "timestamp": "2025-10-23T10:01:01",
             },
         ]
-        mock_memory.get_full_steps.return_value = memory_steps
-        mock_agent_instance.memory = mock_memory
-        mock_tool_calling_agent.return_value = mock_agent_instance
+        mock_agent_instance.memory = _memory(memory_steps)
+        self.mock_tca.return_value = mock_agent_instance
 
         # Initialize AgentManager
-        agent_manager = AgentManager(test_config)
+        agent_manager = manager_factory()
         agent_manager.create_agent("test_agent")
         agent_manager.last_agent = "test_agent"  # Simulate agent was run
 
@@ -146,36 +157,22 @@ class TestPhase1_2HistoryMocked:
         assert retrieved_steps[2]["task"] == "What is the capital of France?"
         assert retrieved_steps[3]["result"] == "Paris"
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_memory_reset_clears_history(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
+    def test_memory_reset_clears_history(self, manager_factory) -> None:
         """Test that memory.reset() clears SmolAgents memory."""
         # Setup mock agent with memory
         mock_agent_instance = MagicMock()
-        mock_memory = MagicMock()
 
         # Pre-populate memory
-        mock_memory.steps = [
-            {"type": "task", "task": "Old prompt"},
-            {"type": "action", "result": "Old response"},
-        ]
-        mock_memory.get_full_steps.return_value = mock_memory.steps.copy()
-
-        # Mock reset behavior
-        def mock_reset():
-            mock_memory.steps.clear()
-
-        mock_memory.reset = mock_reset
-        mock_agent_instance.memory = mock_memory
-        mock_tool_calling_agent.return_value = mock_agent_instance
+        mock_agent_instance.memory = _memory(
+            [
+                {"type": "task", "task": "Old prompt"},
+                {"type": "action", "result": "Old response"},
+            ]
+        )
+        self.mock_tca.return_value = mock_agent_instance
 
         # Initialize AgentManager
-        agent_manager = AgentManager(test_config)
+        agent_manager = manager_factory()
         agent_manager.create_agent("test_agent")
         agent_wrapper = agent_manager.get_agent("test_agent")
 
@@ -186,34 +183,23 @@ class TestPhase1_2HistoryMocked:
         agent_wrapper.agent.memory.reset()
 
         # Verify memory is empty
-        mock_memory.get_full_steps.return_value = []  # Update mock return value
         assert len(agent_wrapper.agent.memory.get_full_steps()) == 0
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_memory_export_to_json(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-        tmp_path: Path,
-    ) -> None:
+    def test_memory_export_to_json(self, manager_factory, tmp_path: Path) -> None:
         """Test exporting SmolAgents memory to JSON file."""
         # Setup mock agent with memory
         mock_agent_instance = MagicMock()
-        mock_memory = MagicMock()
 
         # Memory with conversation history
         memory_steps = [
             {"type": "task", "task": "What is Python?"},
             {"type": "action", "result": "Python is a programming language"},
         ]
-        mock_memory.get_full_steps.return_value = memory_steps
-        mock_agent_instance.memory = mock_memory
-        mock_tool_calling_agent.return_value = mock_agent_instance
+        mock_agent_instance.memory = _memory(memory_steps)
+        self.mock_tca.return_value = mock_agent_instance
 
         # Initialize AgentManager
-        agent_manager = AgentManager(test_config)
+        agent_manager = manager_factory()
         agent_manager.create_agent("test_agent")
         agent_wrapper = agent_manager.get_agent("test_agent")
 
@@ -228,15 +214,13 @@ class TestPhase1_2HistoryMocked:
             "total_steps": len(retrieved_steps),
         }
 
-        with open(export_file, "w") as f:
-            json.dump(export_data, f, indent=2)
+        export_file.write_text(json.dumps(export_data))
 
         # Verify file was created
         assert export_file.exists()
 
         # Load and verify contents
-        with open(export_file, "r") as f:
-            loaded_data = json.load(f)
+        loaded_data = json.loads(export_file.read_text())
 
         assert loaded_data["agent_name"] == "test_agent"
         assert loaded_data["total_steps"] == 2
@@ -244,43 +228,48 @@ class TestPhase1_2HistoryMocked:
         assert loaded_data["steps"][0]["task"] == "What is Python?"
         assert loaded_data["steps"][1]["result"] == "Python is a programming language"
 
-    @patch("simple_agent.agents.model_factory.LiteLLMModel")
-    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
-    def test_separate_memory_per_agent(
-        self,
-        mock_tool_calling_agent: MagicMock,
-        mock_litellm: MagicMock,
-        test_config: dict,
-    ) -> None:
-        """Test that each agent maintains separate memory."""
-        # Setup mock for auto-loaded default agent
-        mock_default_agent = MagicMock()
-        mock_default_memory = MagicMock()
-        mock_default_memory.steps = []
-        mock_default_memory.get_full_steps.return_value = []
-        mock_default_agent.memory = mock_default_memory
+    def test_memory_export_to_jsonl(self, manager_factory, tmp_path: Path) -> None:
+        """Test /history save writes one JSON Lines record per memory step."""
+        memory_steps = [
+            {"type": "task", "task": "What is Python?"},
+            {"type": "action", "result": "Python is a programming language"},
+        ]
+        self.mock_tca.return_value = MagicMock(memory=_memory(memory_steps))
+
+        agent_manager = manager_factory()
+        agent_manager.create_agent("test_agent")
+        agent_manager.last_agent = "test_agent"  # Simulate agent was run
 
+        # Export through the real command
+        export_file = tmp_path / "history_export.jsonl"
+        result = CliRunner().invoke(
+            history,
+            ["save", str(export_file)],
+            obj={"console": MagicMock(), "agent_manager": agent_manager},
+        )
+        assert result.exit_code == 0
+
+        # Each line round-trips to one step
+        lines = export_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == memory_steps
+
+    def test_separate_memory_per_agent(self, manager_factory) -> None:
+        """Test that each agent maintains separate memory."""
         # Setup two mock agents with separate memories
         mock_agent1 = MagicMock()
-        mock_memory1 = MagicMock()
-        mock_memory1.steps = [{"type": "task", "task": "Agent 1 task"}]
-        mock_memory1.get_full_steps.return_value = mock_memory1.steps.copy()
-        mock_agent1.memory = mock_memory1
+        mock_agent1.memory = _memory([{"type": "task", "task": "Agent 1 task"}])
 
         mock_agent2 = MagicMock()
-        mock_memory2 = MagicMock()
-        mock_memory2.steps = [{"type": "task", "task": "Agent 2 task"}]
-        mock_memory2.get_full_steps.return_value = mock_memory2.steps.copy()
-        mock_agent2.memory = mock_memory2
+        mock_agent2.memory = _memory([{"type": "task", "task": "Agent 2 task"}])
 
         # Return different agents on successive calls (agent1, agent2)
-        mock_tool_calling_agent.side_effect = [
+        self.mock_tca.side_effect = [
             mock_agent1,
             mock_agent2,
         ]
 
         # Initialize AgentManager and create two agents
-        agent_manager = AgentManager(test_config)
+        agent_manager = manager_factory()
         agent_manager.create_agent("agent1")
         agent_manager.create_agent("agent2")
 
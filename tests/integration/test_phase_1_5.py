@@ -4,43 +4,76 @@ Integration tests for Phase 1.5 - YAML Agent Definitions.
 Tests the full workflow of YAML agent loading, saving, and auto-loading.
 """
 
-import os
-import shutil
-import tempfile
+import copy
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
 from simple_agent.core.agent_manager import AgentManager
+from simple_agent.core.config_manager import YAML_LOADER
 from simple_agent.core.tool_manager import ToolManager
 
 
+# Minimal OpenAI config shared by the tests (treat as read-only)
+_CONFIG = {
+    "llm": {
+        "provider": "openai",
+        "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def config() -> dict:
+    """Shared test config.
+
+    load_agent_from_yaml merges a YAML model section into the manager's
+    config, so managers that load such files get a deep copy.
+    """
+    return _CONFIG
+
+
+# Agent definitions read (never written) by the tests
+_AGENT1_YAML = """
+name: "agent1"
+role: "Agent 1"
+"""
+
+_AGENT2_YAML = """
+name: "agent2"
+role: "Agent 2"
+"""
+
+_CUSTOM_AGENT_YAML = """
+name: "custom_agent"
+role: "Custom role from YAML"
+"""
+
+
+@pytest.fixture(scope="class")
+def yaml_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the read-only agent YAML files once per class.
+
+    agents/ holds exactly agent1.yaml and agent2.yaml for directory loading;
+    custom_agent.yaml sits beside it so it is not picked up by that load.
+    """
+    base = tmp_path_factory.mktemp("yaml")
+    agents_dir = base / "agents"
+    agents_dir.mkdir()
+    (agents_dir / "agent1.yaml").write_text(_AGENT1_YAML)
+    (agents_dir / "agent2.yaml").write_text(_AGENT2_YAML)
+    (base / "custom_agent.yaml").write_text(_CUSTOM_AGENT_YAML)
+    return base
+
+
 class TestPhase1_5YAMLAgents:
     """Integration tests for YAML agent definitions."""
 
-    @pytest.fixture
-    def temp_agents_dir(self) -> str:
-        """Create temporary agents directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        # Cleanup
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def config(self) -> dict:
-        """Create test config."""
-        return {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            }
-        }
-
     @patch("simple_agent.core.agent_manager.SimpleAgent")
     def test_save_and_load_agent_workflow(
-        self, mock_simple_agent: MagicMock, temp_agents_dir: str, config: dict
+        self, mock_simple_agent: MagicMock, tmp_path: Path, config: dict
     ) -> None:
         """
         Test complete save/load workflow.
@@ -65,22 +98,21 @@ class TestPhase1_5YAMLAgents:
         manager.create_agent("test_agent", role="You are a test agent.")
 
         # Save to YAML
-        yaml_path = os.path.join(temp_agents_dir, "test_agent.yaml")
+        yaml_path = str(tmp_path / "test_agent.yaml")
         manager.save_agent_to_yaml("test_agent", yaml_path)
 
         # Verify file exists
-        assert os.path.exists(yaml_path)
+        assert Path(yaml_path).exists()
 
         # Load YAML and verify structure
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(Path(yaml_path).read_text(encoding="utf-8"), Loader=YAML_LOADER)
 
         assert data["name"] == "test_agent"
         assert data["agent_type"] == "tool_calling"
         assert data["role"] == "You are a test agent."
 
         # Create new manager and load agent
-        manager2 = AgentManager(config)
+        manager2 = AgentManager(copy.deepcopy(config))
         loaded_agent = manager2.load_agent_from_yaml(yaml_path)
 
         # Verify agent was loaded
@@ -89,7 +121,7 @@ class TestPhase1_5YAMLAgents:
 
     @patch("simple_agent.core.agent_manager.SimpleAgent")
     def test_auto_load_agents_from_directory(
-        self, mock_simple_agent: MagicMock, temp_agents_dir: str, config: dict
+        self, mock_simple_agent: MagicMock, yaml_dir: Path, config: dict
     ) -> None:
         """
         Test auto-loading agents from directory.
@@ -98,22 +130,7 @@ class TestPhase1_5YAMLAgents:
         2. Load from directory
         3. Verify all valid agents loaded
         """
-        # Create agent YAML files
-        agent1_yaml = """
-name: "agent1"
-role: "Agent 1"
-"""
-        agent2_yaml = """
-name: "agent2"
-role: "Agent 2"
-"""
-
-        with open(os.path.join(temp_agents_dir, "agent1.yaml"), "w") as f:
-            f.write(agent1_yaml)
-
-        with open(os.path.join(temp_agents_dir, "agent2.yaml"), "w") as f:
-            f.write(agent2_yaml)
-
+        # Agent YAML files are written once by the yaml_dir fixture
         # Mock agent
         mock_agent_instance = MagicMock()
         mock_agent_instance.tools = []
@@ -121,7 +138,7 @@ role: "Agent 2"
 
         # Load agents from directory
         manager = AgentManager(config)
-        count = manager.load_agents_from_directory(temp_agents_dir)
+        count = manager.load_agents_from_directory(str(yaml_dir / "agents"))
 
         # Verify agents loaded
         assert count == 2
@@ -130,7 +147,7 @@ role: "Agent 2"
 
     @patch("simple_agent.core.agent_manager.SimpleAgent")
     def test_agent_with_tools_save_load(
-        self, mock_simple_agent: MagicMock, temp_agents_dir: str, config: dict
+        self, mock_simple_agent: MagicMock, tmp_path: Path, config: dict
     ) -> None:
         """
         Test saving and loading agent with tools.
@@ -170,19 +187,18 @@ role: "Agent 2"
         )
 
         # Save to YAML
-        yaml_path = os.path.join(temp_agents_dir, "math_agent.yaml")
+        yaml_path = str(tmp_path / "math_agent.yaml")
         manager.save_agent_to_yaml("math_agent", yaml_path)
 
         # Verify tools in YAML
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(Path(yaml_path).read_text(encoding="utf-8"), Loader=YAML_LOADER)
 
         assert "tools" in data
         assert "add" in data["tools"]
         assert "multiply" in data["tools"]
 
         # Load agent (new manager)
-        manager2 = AgentManager(config)
+        manager2 = AgentManager(copy.deepcopy(config))
         manager2.tool_manager = tool_manager
         manager2.load_agent_from_yaml(yaml_path)
 
@@ -191,7 +207,7 @@ role: "Agent 2"
 
     @patch("simple_agent.core.agent_manager.SimpleAgent")
     def test_agent_hierarchy_yaml_overrides_config(
-        self, mock_simple_agent: MagicMock, temp_agents_dir: str
+        self, mock_simple_agent: MagicMock, yaml_dir: Path
     ) -> None:
         """
         Test agent hierarchy: YAML > config.yaml.
@@ -213,14 +229,8 @@ role: "Agent 2"
             },
         }
 
-        # Create YAML with different role
-        agent_yaml = """
-name: "custom_agent"
-role: "Custom role from YAML"
-"""
-        yaml_path = os.path.join(temp_agents_dir, "custom_agent.yaml")
-        with open(yaml_path, "w") as f:
-            f.write(agent_yaml)
+        # YAML with different role, written by the yaml_dir fixture
+        yaml_file = yaml_dir / "custom_agent.yaml"
 
         # Mock agent
         mock_agent_instance = MagicMock()
@@ -229,7 +239,7 @@ role: "Custom role from YAML"
 
         # Load agent
         manager = AgentManager(config)
-        manager.load_agent_from_yaml(yaml_path)
+        manager.load_agent_from_yaml(str(yaml_file))
 
         # Verify YAML role was used (not config default)
         # Check that create_agent was called with YAML role
@@ -12,6 +12,12 @@ from simple_agent.guardrails.custom_rule import CustomRuleGuardrail
 from simple_agent.guardrails.yaml_loader import load_guardrails_from_yaml
 
 
+@pytest.fixture
+def mock_agent() -> Mock:
+    """Wrapped agent double; spec limits it to run() so no attributes are auto-created."""
+    return Mock(spec=["run"])
+
+
 class TestPhase21Integration:
     """Integration tests for Phase 2.1 Guardrails."""
 
@@ -61,11 +67,9 @@ class TestPhase21Integration:
         with pytest.raises(GuardrailViolation):
             guardrail.process("a" * 101)
 
-    def test_guardrail_agent_with_pii_detector(self):
+    def test_guardrail_agent_with_pii_detector(self, mock_agent):
         """Test GuardrailAgent with PIIDetector in real workflow."""
-        # Create mock agent
-        mock_agent = Mock()
-        mock_agent.run = Mock(return_value="Response processed")
+        mock_agent.run.return_value = "Response processed"
 
         # Create guardrail agent with PII detector
         pii_detector = PIIDetector(types=["email"], redact=True)
@@ -81,10 +85,8 @@ class TestPhase21Integration:
         assert "[EMAIL]" in call_args
         assert result == "Response processed"
 
-    def test_guardrail_agent_rejects_on_violation(self):
+    def test_guardrail_agent_rejects_on_violation(self, mock_agent):
         """Test GuardrailAgent rejects input on guardrail violation."""
-        mock_agent = Mock()
-
         # Rejecting PII detector
         pii_detector = PIIDetector(types=["ssn"], redact=False)
         guardrail_agent = GuardrailAgent(mock_agent, input_guardrails=[pii_detector])
@@ -96,10 +98,9 @@ class TestPhase21Integration:
         # Agent should not be called
         mock_agent.run.assert_not_called()
 
-    def test_guardrail_agent_with_multiple_guardrails(self):
+    def test_guardrail_agent_with_multiple_guardrails(self, mock_agent):
         """Test GuardrailAgent with multiple guardrails in sequence."""
-        mock_agent = Mock()
-        mock_agent.run = Mock(return_value="Done")
+        mock_agent.run.return_value = "Done"
 
         # First guardrail: redact emails
         email_detector = PIIDetector(types=["email"], redact=True)
@@ -188,7 +189,7 @@ guardrails:
         assert "or call" in result
         assert "must be protected" in result
 
-    def test_custom_rule_chaining(self):
+    def test_custom_rule_chaining(self, mock_agent):
         """Test multiple custom rules applied in sequence."""
 
         def remove_profanity(text: str) -> str:
@@ -202,8 +203,7 @@ guardrails:
         rule1 = CustomRuleGuardrail(remove_profanity)
         rule2 = CustomRuleGuardrail(uppercase)
 
-        mock_agent = Mock()
-        mock_agent.run = Mock(return_value="OK")
+        mock_agent.run.return_value = "OK"
 
         guardrail_agent = GuardrailAgent(mock_agent, input_guardrails=[rule1, rule2])
 
@@ -1,69 +1,61 @@
 """Integration tests for Phase 2.4: Multi-Agent Orchestration."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
 
-from simple_agent.agents.simple_agent import SimpleAgent
 from simple_agent.orchestration.agent_tool import AgentTool
 from simple_agent.orchestration.orchestrator_agent import OrchestratorAgent
 from simple_agent.orchestration.flow_manager import FlowManager
 from simple_agent.commands.flow_commands import FlowCommands
 
+# SimpleAgent attributes AgentTool touches; spec_set rejects anything else
+_SUB_AGENT_ATTRS = ["name", "run"]
+
+# Sample two-agent flow, written verbatim by temp_flows_dir
+FLOW_YAML = """\
+name: test_workflow
+description: Test multi-agent workflow
+sub_agents:
+- name: researcher
+  description: Research agent
+  config: config/agents/researcher.yaml
+- name: writer
+  description: Writing agent
+  config: config/agents/writer.yaml
+orchestrator:
+  name: coordinator
+  role: Coordinate research and writing
+  model:
+    provider: openai
+"""
+
+
+@pytest.fixture(scope="class")
+def temp_flows_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary flows directory, shared by the class (read-only)."""
+    flows_dir = tmp_path_factory.mktemp("flows")
+    (flows_dir / "test_workflow.yaml").write_text(FLOW_YAML)
+    return flows_dir
+
 
 class TestMultiAgentOrchestration:
     """End-to-end multi-agent orchestration workflows."""
 
     @pytest.fixture
     def mock_agents(self):
-        """Create mock sub-agents."""
-        researcher = MagicMock(spec=SimpleAgent)
+        """Create mock sub-agents exposing only the SimpleAgent surface AgentTool uses."""
+        researcher = MagicMock(spec_set=_SUB_AGENT_ATTRS)
         researcher.name = "researcher"
-        researcher.run = MagicMock(return_value="Research findings on quantum computing")
+        researcher.run.return_value = "Research findings on quantum computing"
 
-        writer = MagicMock(spec=SimpleAgent)
+        writer = MagicMock(spec_set=_SUB_AGENT_ATTRS)
         writer.name = "writer"
-        writer.run = MagicMock(return_value="A comprehensive article on quantum computing")
+        writer.run.return_value = "A comprehensive article on quantum computing"
 
         return {"researcher": researcher, "writer": writer}
 
-    @pytest.fixture
-    def temp_flows_dir(self):
-        """Create temporary flows directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            flows_dir = Path(tmpdir)
-
-            flow_content = {
-                "name": "test_workflow",
-                "description": "Test multi-agent workflow",
-                "sub_agents": [
-                    {
-                        "name": "researcher",
-                        "description": "Research agent",
-                        "config": "config/agents/researcher.yaml"
-                    },
-                    {
-                        "name": "writer",
-                        "description": "Writing agent",
-                        "config": "config/agents/writer.yaml"
-                    }
-                ],
-                "orchestrator": {
-                    "name": "coordinator",
-                    "role": "Coordinate research and writing",
-                    "model": {"provider": "openai"}
-                }
-            }
-
-            flow_file = flows_dir / "test_workflow.yaml"
-            with open(flow_file, "w") as f:
-                yaml.dump(flow_content, f)
-
-            yield flows_dir
-
     def test_agent_tool_wraps_agent(self, mock_agents):
         """AgentTool successfully wraps an agent."""
         researcher = mock_agents["researcher"]
@@ -1,9 +1,25 @@
 """Integration tests for token guard with web tools and agents."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 
+from simple_agent.agents import simple_agent as simple_agent_module
 from simple_agent.core.agent_manager import AgentManager
 from simple_agent.core.tool_manager import ToolManager
+from simple_agent.tools.builtin import page_fetch
+
+
+def _llm_config() -> dict:
+    """Fresh OpenAI llm block shared by every test config (AgentManager may mutate it)."""
+    return {
+        "provider": "openai",
+        "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
+    }
+
+
+@pytest.fixture(scope="module")
+def builtin_tool_manager() -> ToolManager:
+    """ToolManager with built-in tools, shared by the module (treat as read-only)."""
+    return ToolManager(auto_load_builtin=True)
 
 
 class TestTokenGuardWithAgent:
@@ -12,10 +28,7 @@ class TestTokenGuardWithAgent:
     def test_agent_respects_token_budget(self) -> None:
         """Agent should reject prompts exceeding token budget."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "limited": {
                     "role": "Test agent",
@@ -39,10 +52,7 @@ class TestTokenGuardWithAgent:
     def test_agent_with_role_respects_token_budget(self) -> None:
         """Agent with system role should check token budget on combined prompt."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "researcher": {
                     "role": "You are a research assistant. " * 20,  # Medium-sized role
@@ -63,13 +73,10 @@ class TestTokenGuardWithAgent:
 
         assert "token" in str(exc_info.value).lower() or "budget" in str(exc_info.value).lower()
 
-    def test_agent_without_token_budget_allows_large_prompts(self) -> None:
+    def test_agent_without_token_budget_allows_large_prompts(self, monkeypatch) -> None:
         """Agent without token budget should allow large prompts."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "unrestricted": {
                     "role": "Helper",
@@ -86,21 +93,18 @@ class TestTokenGuardWithAgent:
         large_prompt = "a" * 5000
 
         # Mock the agent's run method to prevent actual LLM call
-        with patch.object(agent.agent, "run", return_value="Response"):
-            result = agent.run(large_prompt)
-            # Should reach the agent.run() call (token guard passed)
-            # AgentResult supports string conversion for backward compatibility
-            assert str(result) == "Response"
+        monkeypatch.setattr(agent.agent, "run", MagicMock(return_value="Response"))
+        result = agent.run(large_prompt)
+        # Should reach the agent.run() call (token guard passed)
+        # AgentResult supports string conversion for backward compatibility
+        assert str(result) == "Response"
 
-    def test_warning_threshold_logs_warning(self) -> None:
+    def test_warning_threshold_logs_warning(self, monkeypatch) -> None:
         """Agent approaching warning threshold should log warning."""
         import logging
 
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "monitored": {
                     "role": "Test",
@@ -118,29 +122,27 @@ class TestTokenGuardWithAgent:
         # Need to craft a prompt that's between 4000 and 5000 tokens
         medium_prompt = "This is a test. " * 250  # ~1000 tokens, well under budget
 
-        with patch.object(agent.agent, "run", return_value="Response"):
-            with patch("simple_agent.agents.simple_agent.logger") as mock_logger:
-                result = agent.run(medium_prompt)
+        mock_logger = MagicMock()
+        monkeypatch.setattr(agent.agent, "run", MagicMock(return_value="Response"))
+        monkeypatch.setattr(simple_agent_module, "logger", mock_logger)
+        result = agent.run(medium_prompt)
 
-                # Should succeed but might log warning depending on token count
-                # AgentResult supports string conversion for backward compatibility
-                assert str(result) == "Response"
-                # Logger was available for warnings
-                assert hasattr(mock_logger, "warning")
+        # Should succeed but might log warning depending on token count
+        # AgentResult supports string conversion for backward compatibility
+        assert str(result) == "Response"
+        # Logger was available for warnings
+        assert hasattr(mock_logger, "warning")
 
 
 class TestTokenGuardWithFetchWebpageTool:
     """Test token guard with fetch_webpage_markdown tool and HTML cleaning."""
 
-    def test_token_guard_works_with_web_tools_enabled(self) -> None:
+    def test_token_guard_works_with_web_tools_enabled(
+        self, builtin_tool_manager: ToolManager
+    ) -> None:
         """Agent with web tools should still respect token budget."""
-        tool_manager = ToolManager(auto_load_builtin=True)
-
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "researcher": {
                     "role": "Research assistant",
@@ -151,7 +153,7 @@ class TestTokenGuardWithFetchWebpageTool:
         }
 
         agent_manager = AgentManager(config)
-        agent_manager.tool_manager = tool_manager
+        agent_manager.tool_manager = builtin_tool_manager
         agent_manager._load_agents_from_config()
         agent = agent_manager.get_agent("researcher")
 
@@ -163,30 +165,30 @@ class TestTokenGuardWithFetchWebpageTool:
 
         assert "token" in str(exc_info.value).lower()
 
-    def test_fetch_webpage_markdown_token_counting(self) -> None:
+    def test_fetch_webpage_markdown_token_counting(
+        self, builtin_tool_manager: ToolManager, monkeypatch
+    ) -> None:
         """fetch_webpage_markdown should return token counts."""
-        tool_manager = ToolManager(auto_load_builtin=True)
-        fetch_tool = tool_manager.get_tool("fetch_webpage_markdown")
+        fetch_tool = builtin_tool_manager.get_tool("fetch_webpage_markdown")
 
         # Mock the requests.get to return sample HTML
-        with patch("simple_agent.tools.builtin.page_fetch.requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.text = "<html><body><p>Test content here</p></body></html>"
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+        mock_response = MagicMock()
+        mock_response.text = "<html><body><p>Test content here</p></body></html>"
+        mock_response.raise_for_status = MagicMock()
+        monkeypatch.setattr(page_fetch.requests, "get", MagicMock(return_value=mock_response))
 
-            # Call the tool
-            result = fetch_tool("https://example.com")
+        # Call the tool
+        result = fetch_tool("https://example.com")
 
-            # Should have token_used
-            assert "tokens_used" in result
-            assert isinstance(result["tokens_used"], int)
-            assert result["tokens_used"] > 0
+        # Should have token_used
+        assert "tokens_used" in result
+        assert isinstance(result["tokens_used"], int)
+        assert result["tokens_used"] > 0
 
-            # Should have other fields
-            assert "original_size" in result
-            assert "was_truncated" in result
-            assert result["success"] is True
+        # Should have other fields
+        assert "original_size" in result
+        assert "was_truncated" in result
+        assert result["success"] is True
 
 
 class TestTokenGuardConfigIntegration:
@@ -195,10 +197,7 @@ class TestTokenGuardConfigIntegration:
     def test_researcher_agent_from_config_has_token_protection(self) -> None:
         """Researcher agent configured in YAML should have token protection."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "researcher": {
                     "role": "You are a web research specialist.",
@@ -221,10 +220,7 @@ class TestTokenGuardConfigIntegration:
     def test_multiple_agents_with_different_budgets(self) -> None:
         """Different agents can have different token budgets from config."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
+            "llm": _llm_config(),
             "agents": {
                 "planner": {
                     "role": "Planner",
@@ -256,58 +252,33 @@ class TestTokenGuardConfigIntegration:
 class TestTokenGuardEdgeCasesWithRealTokens:
     """Test edge cases using real token counting."""
 
-    def test_system_role_adds_to_token_count(self) -> None:
-        """System role should contribute to token count."""
+    @pytest.mark.parametrize(
+        ("role", "budget", "prompt"),
+        [
+            # System role contributes to the count, so a short prompt still fails
+            ("You are a verbose assistant. " * 100, 200, "test"),
+            # The injected budget context alone outweighs a 20-token budget
+            ("Helper", 20, "hi"),
+        ],
+        ids=["verbose_role", "tiny_budget"],
+    )
+    def test_tight_budget_rejects_short_prompt(
+        self, role: str, budget: int, prompt: str, monkeypatch
+    ) -> None:
+        """Role text and budget context both count against the token budget."""
         config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
-            "agents": {
-                "verbose": {
-                    "role": "You are a verbose assistant. " * 100,
-                    "token_budget": 200,  # Very tight budget
-                }
-            },
+            "llm": _llm_config(),
+            "agents": {"edge": {"role": role, "token_budget": budget}},
         }
 
         agent_manager = AgentManager(config)
         agent_manager._load_agents_from_config()
-        agent = agent_manager.get_agent("verbose")
-
-        # Token budget includes both role and prompt
-        assert agent.token_budget == 200
-
-        # Even short prompts should fail with such a tight budget
-        with pytest.raises(ValueError):
-            agent.run("test")
-
-    def test_token_budget_exactly_matched(self) -> None:
-        """Prompt exactly matching token budget should be accepted."""
-        config = {
-            "llm": {
-                "provider": "openai",
-                "openai": {"model": "gpt-4o-mini", "api_key": "sk-test"},
-            },
-            "agents": {
-                "precise": {
-                    "role": "Helper",
-                    "token_budget": 20,  # Very small
-                }
-            },
-        }
+        agent = agent_manager.get_agent("edge")
+        assert agent.token_budget == budget
 
-        agent_manager = AgentManager(config)
-        agent_manager._load_agents_from_config()
-        agent = agent_manager.get_agent("precise")
-
-        # Short prompt that should fit exactly or close
-        with patch.object(agent.agent, "run", return_value="Response"):
-            # This might pass or fail depending on exact token count of role + "hi"
-            try:
-                result = agent.run("hi")
-                # If it passes, good - token guard allowed it
-                assert result == "Response"
-            except ValueError:
-                # If it fails, also good - token guard rejected it correctly
-                pass
+        # Rejected before the model is ever called
+        model_run = MagicMock(return_value="Response")
+        monkeypatch.setattr(agent.agent, "run", model_run)
+        with pytest.raises(ValueError, match="Token budget exceeded"):
+            agent.run(prompt)
+        model_run.assert_not_called()
@@ -2,6 +2,7 @@
 
 import pytest
 from decimal import Decimal
+from unittest.mock import MagicMock
 
 from simple_agent.core.agent_result import AgentResult
 from simple_agent.tools.helpers.token_tracker import TokenStats
@@ -43,6 +44,16 @@ class TestAgentResult:
         # Should be comparable to string
         assert str(result) == response_text
 
+    def test_agent_result_text_is_cached(self) -> None:
+        """AgentResult.text should convert the response once and reuse it."""
+        response = MagicMock()
+        response.__str__.return_value = "Cached text"
+        result = AgentResult(response=response)
+
+        assert result.text == "Cached text"
+        assert str(result) == "Cached text"
+        assert response.__str__.call_count == 1
+
     def test_agent_result_with_dict_response(self) -> None:
         """AgentResult should handle dict responses."""
         response_dict = {"key": "value", "number": 42}
@@ -5,9 +5,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from simple_agent.agents.simple_agent import SimpleAgent
 from simple_agent.orchestration.agent_tool import AgentTool
 
+# SimpleAgent attributes AgentTool touches; spec_set rejects anything else
+_SUB_AGENT_ATTRS = ["name", "run"]
+
 
 class TestAgentTool:
     """AgentTool wraps agents as tools for orchestrators."""
@@ -15,9 +17,9 @@ class TestAgentTool:
     @pytest.fixture
     def mock_agent(self):
         """Create a mock SimpleAgent."""
-        agent = MagicMock(spec=SimpleAgent)
+        agent = MagicMock(spec_set=_SUB_AGENT_ATTRS)
         agent.name = "test_agent"
-        agent.run = MagicMock(return_value="Test output from agent")
+        agent.run.return_value = "Test output from agent"
         return agent
 
     def test_agent_tool_creation(self, mock_agent):
@@ -27,7 +27,7 @@ class TestApprovalManager:
     def test_approval_manager_initialization(self, approval_manager):
         """Test ApprovalManager initializes correctly."""
         assert approval_manager.pending_approval is None
-        assert approval_manager.history == []
+        assert list(approval_manager.history) == []
 
     def test_request_approval_pending(self, approval_manager):
         """Test requesting approval creates pending request."""
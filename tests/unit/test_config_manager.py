@@ -6,6 +6,7 @@ Tests configuration loading, saving, accessing, and template management.
 
 import os
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 import yaml
@@ -56,6 +57,41 @@ class TestConfigManagerLoad:
         with pytest.raises(ValueError, match="must be a dictionary"):
             ConfigManager.load(str(config_file))
 
+    def test_load_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Test mutating a loaded config does not affect later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"app": {"name": "test"}}))
+
+        first = ConfigManager.load(str(config_file), validate=False)
+        first["app"]["name"] = "mutated"
+        second = ConfigManager.load(str(config_file), validate=False)
+
+        assert second == {"app": {"name": "test"}}
+
+    def test_load_picks_up_file_changes(self, tmp_path: Path) -> None:
+        """Test editing the file invalidates the cached parse."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"app": {"name": "before"}}))
+        ConfigManager.load(str(config_file), validate=False)
+
+        config_file.write_text(yaml.dump({"app": {"name": "after-edit"}}))
+        result = ConfigManager.load(str(config_file), validate=False)
+
+        assert result == {"app": {"name": "after-edit"}}
+
+    def test_load_parses_each_path_once(self, tmp_path: Path, monkeypatch) -> None:
+        """Test repeated loads of one file, by any path spelling, parse YAML once."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"app": {"name": "test"}}))
+        monkeypatch.chdir(tmp_path)
+        yaml_load = Mock(wraps=yaml.load)
+        monkeypatch.setattr(yaml, "load", yaml_load)
+
+        ConfigManager.load(str(config_file), validate=False)
+        ConfigManager.load("config.yaml", validate=False)
+
+        assert yaml_load.call_count == 1
+
 
 class TestConfigManagerGet:
     """Test nested configuration value access."""
@@ -56,6 +56,51 @@ class TestCustomRuleGuardrail:
         result = guardrail.process(text)
         assert result == "This is good content"
 
+    def test_fuse_applies_rules_in_order(self):
+        """Test fused rules run in sequence as one guardrail."""
+
+        def censor(text: str) -> str:
+            return text.replace("bad", "good")
+
+        def shout(text: str) -> str:
+            return text.upper()
+
+        fused = CustomRuleGuardrail.fuse(
+            [CustomRuleGuardrail(censor), CustomRuleGuardrail(shout)]
+        )
+
+        assert fused.process("this is bad") == "THIS IS GOOD"
+        assert fused.name == "censor+shout"
+
+    def test_fused_violation_names_rule_that_fired(self):
+        """Test a violation inside a fused chain reports the original rule name."""
+
+        def allow(text: str) -> str:
+            return text
+
+        def no_urls(text: str) -> str:
+            if "http" in text:
+                raise GuardrailViolation("URLs not allowed")
+            return text
+
+        fused = CustomRuleGuardrail.fuse(
+            [CustomRuleGuardrail(allow), CustomRuleGuardrail(no_urls)]
+        )
+
+        with pytest.raises(GuardrailViolation) as exc_info:
+            fused.process("see http://example.com")
+        assert exc_info.value.guardrail_type == "no_urls"
+        assert str(exc_info.value) == "[no_urls] URLs not allowed"
+
+    def test_fuse_uses_current_rule_functions(self):
+        """Test a rule function replaced after fusing is the one that runs."""
+        rule = CustomRuleGuardrail(lambda text: text)
+        fused = CustomRuleGuardrail.fuse([rule, CustomRuleGuardrail(lambda text: text)])
+
+        rule.rule_func = lambda text: text.upper()
+
+        assert fused.process("hello") == "HELLO"
+
     def test_guardrail_with_name(self):
         """Test CustomRuleGuardrail stores function name."""
 
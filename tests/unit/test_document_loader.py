@@ -3,6 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -73,6 +74,29 @@ class TestDocumentLoader:
         file_names = [doc["source"] for doc in documents]
         assert any("nested.txt" in fn for fn in file_names)
 
+    def test_load_directory_returns_documents_in_path_order(self, temp_dir):
+        """Test concurrent loading still returns documents in a stable order."""
+        documents = DocumentLoader.load_directory(temp_dir)
+
+        names = [Path(doc["source"]).relative_to(temp_dir).as_posix() for doc in documents]
+        assert names == ["sample.md", "sample.txt", "subdir/nested.txt"]
+
+    def test_load_directory_skips_unreadable_subdirectory(self, temp_dir):
+        """Test a subdirectory that cannot be listed is skipped, not fatal."""
+        real_scandir = os.scandir
+        subdir = os.path.join(temp_dir, "subdir")
+
+        def scandir(path):
+            if path == subdir:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        with patch("simple_agent.rag.document_loader.os.scandir", side_effect=scandir):
+            documents = DocumentLoader.load_directory(temp_dir)
+
+        names = [Path(doc["source"]).name for doc in documents]
+        assert names == ["sample.md", "sample.txt"]
+
     def test_load_directory_ignores_other_types(self, temp_dir):
         """Test that non-txt/md files are ignored."""
         # Create a file with unsupported extension
@@ -128,6 +152,11 @@ class TestDocumentLoader:
         combined = "".join(chunks)
         assert text in combined or all(word in combined for word in text.split())
 
+    def test_chunk_text_rejects_overlap_not_below_chunk_size(self):
+        """Test overlap >= chunk_size raises instead of looping forever."""
+        with pytest.raises(ValueError, match="overlap"):
+            DocumentLoader.chunk_text("Some text", chunk_size=10, overlap=10)
+
     def test_extract_metadata_txt(self, temp_dir):
         """Test extracting metadata from file."""
         file_path = Path(temp_dir) / "sample.txt"
@@ -160,6 +189,17 @@ class TestDocumentLoader:
         assert metadata1["chunk_index"] == 0
         assert metadata2["chunk_index"] == 5
 
+    def test_extract_chunk_metadata_stats_file_once(self, temp_dir):
+        """Test per-chunk metadata shares one stat of the source file."""
+        file_path = str(Path(temp_dir) / "sample.txt")
+
+        with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as stat:
+            chunk_metadata = DocumentLoader.extract_chunk_metadata(file_path, chunk_count=3)
+
+        assert stat.call_count == 1
+        assert [m["chunk_index"] for m in chunk_metadata] == [0, 1, 2]
+        assert chunk_metadata[2] == DocumentLoader.extract_metadata(file_path, chunk_index=2)
+
     def test_load_file_returns_dict_with_content(self, temp_dir):
         """Test that load_file returns dict with 'content' and 'source' keys."""
         file_path = Path(temp_dir) / "sample.txt"
@@ -78,6 +78,25 @@ class TestEmbeddingProvider:
         assert len(embeddings) == 1
         assert embeddings[0] == [0.2, 0.3, 0.4]
 
+    @patch("simple_agent.rag.embedding_provider.litellm.embedding")
+    def test_get_embeddings_batches_large_inputs(self, mock_embed, monkeypatch):
+        """Test inputs beyond BATCH_SIZE are sent in ordered batches."""
+        monkeypatch.setattr(EmbeddingProvider, "BATCH_SIZE", 2)
+        mock_embed.side_effect = lambda model, input: {
+            "data": [{"embedding": [float(text)]} for text in input]
+        }
+
+        embeddings = EmbeddingProvider.get_embeddings(
+            ["1", "2", "3", "4", "5"], model="text-embedding-ada-002"
+        )
+
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert [c.kwargs["input"] for c in mock_embed.call_args_list] == [
+            ["1", "2"],
+            ["3", "4"],
+            ["5"],
+        ]
+
     def test_validate_model_valid_openai(self):
         """Test model validation for OpenAI model."""
         result = EmbeddingProvider.validate_model("text-embedding-ada-002")
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 import yaml
 
+from simple_agent.core.config_manager import YAML_DUMPER
 from simple_agent.orchestration.flow_manager import FlowManager
 
 
@@ -42,7 +43,7 @@ class TestFlowManager:
 
             flow_file = flows_dir / "example_flow.yaml"
             with open(flow_file, "w") as f:
-                yaml.dump(flow_content, f)
+                yaml.dump(flow_content, f, Dumper=YAML_DUMPER)
 
             yield flows_dir
 
@@ -82,6 +83,22 @@ class TestFlowManager:
         # Should be same object (cached)
         assert flow1 is flow2
 
+    def test_load_flow_parses_file_once_across_managers(
+        self, mock_agent_manager, temp_flows_dir, monkeypatch
+    ):
+        """Separate FlowManagers share one parse and get independent copies."""
+        yaml_load = MagicMock(wraps=yaml.load)
+        monkeypatch.setattr(yaml, "load", yaml_load)
+
+        first = FlowManager(agent_manager=mock_agent_manager, flows_dir=str(temp_flows_dir))
+        second = FlowManager(agent_manager=mock_agent_manager, flows_dir=str(temp_flows_dir))
+        flow1 = first.load_flow("example_flow")
+        flow1["name"] = "mutated"
+        flow2 = second.load_flow("example_flow")
+
+        assert yaml_load.call_count == 1
+        assert flow2["name"] == "example_flow"
+
     def test_load_nonexistent_flow_raises(self, mock_agent_manager):
         """FlowManager raises for nonexistent flow."""
         manager = FlowManager(agent_manager=mock_agent_manager, flows_dir="/nonexistent")
@@ -90,6 +90,24 @@ class TestGuardrailAgent:
 
         assert result == "Response"
 
+    def test_guardrail_appended_after_construction_applies(self):
+        """Test guardrails added to input_guardrails after construction are enforced."""
+        mock_agent = Mock()
+        guardrail_agent = GuardrailAgent(mock_agent, input_guardrails=[])
+        guardrail_agent.run("Contact test@example.com")
+
+        guardrail_agent.input_guardrails.append(PIIDetector(types=["email"], redact=False))
+
+        with pytest.raises(GuardrailViolation):
+            guardrail_agent.run("Contact test@example.com")
+        assert mock_agent.run.call_count == 1
+
+        guardrail_agent.input_guardrails.append(
+            CustomRuleGuardrail(lambda text: text.upper())
+        )
+        guardrail_agent.run("no pii here")
+        mock_agent.run.assert_called_with("NO PII HERE")
+
     def test_guardrail_order_matters(self):
         """Test that guardrails are applied in order."""
         mock_agent = Mock()
@@ -106,6 +124,22 @@ class TestGuardrailAgent:
         call_args = mock_agent.run.call_args[0][0]
         assert call_args == "THIS IS GOOD"
 
+    def test_consecutive_custom_rules_run_as_one_stage(self):
+        """Test adjacent custom rules are fused while order is preserved."""
+        mock_agent = Mock()
+        pii_detector = PIIDetector(types=["email"], redact=True)
+        rule1 = CustomRuleGuardrail(lambda text: text.replace("bad", "good"))
+        rule2 = CustomRuleGuardrail(lambda text: text.upper())
+
+        guardrail_agent = GuardrailAgent(
+            mock_agent, input_guardrails=[pii_detector, rule1, rule2]
+        )
+        guardrail_agent.run("bad a@b.com")
+
+        assert guardrail_agent.input_guardrails == [pii_detector, rule1, rule2]
+        assert len(guardrail_agent._stages) == 2
+        mock_agent.run.assert_called_once_with("GOOD [EMAIL]")
+
     def test_custom_rule_guardrail_in_chain(self):
         """Test custom rule as part of guardrail chain."""
 
@@ -1,12 +1,12 @@
 """Unit tests for YAML guardrail configuration - TDD approach."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from simple_agent.guardrails.input_validators import PIIDetector
-from simple_agent.guardrails.yaml_loader import load_guardrails_from_yaml
+from simple_agent.guardrails.yaml_loader import (
+    load_guardrails_from_string,
+    load_guardrails_from_yaml,
+)
 
 
 class TestGuardrailYAMLLoader:
@@ -22,18 +22,9 @@ input_guardrails:
       - "email"
       - "phone"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            guardrails_config = load_guardrails_from_yaml(temp_path)
-            assert "input_guardrails" in guardrails_config
-            assert len(guardrails_config["input_guardrails"]) == 1
-        finally:
-            # Clean up - file is now closed so Windows can delete it
-            Path(temp_path).unlink(missing_ok=True)
+        guardrails_config = load_guardrails_from_string(yaml_content)
+        assert "input_guardrails" in guardrails_config
+        assert len(guardrails_config["input_guardrails"]) == 1
 
     def test_load_multiple_guardrails(self):
         """Test loading multiple guardrails from YAML."""
@@ -47,19 +38,10 @@ input_guardrails:
   - type: "custom"
     function: "my_module.check_sql"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            guardrails_config = load_guardrails_from_yaml(temp_path)
-            assert len(guardrails_config["input_guardrails"]) == 2
-            assert guardrails_config["input_guardrails"][0]["type"] == "pii_detector"
-            assert guardrails_config["input_guardrails"][1]["type"] == "custom"
-        finally:
-            # Clean up - file is now closed so Windows can delete it
-            Path(temp_path).unlink(missing_ok=True)
+        guardrails_config = load_guardrails_from_string(yaml_content)
+        assert len(guardrails_config["input_guardrails"]) == 2
+        assert guardrails_config["input_guardrails"][0]["type"] == "pii_detector"
+        assert guardrails_config["input_guardrails"][1]["type"] == "custom"
 
     def test_load_empty_guardrails(self):
         """Test loading YAML with no guardrails."""
@@ -67,19 +49,10 @@ input_guardrails:
 name: "test_agent"
 role: "Test agent"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            guardrails_config = load_guardrails_from_yaml(temp_path)
-            assert "input_guardrails" not in guardrails_config or not guardrails_config.get(
-                "input_guardrails"
-            )
-        finally:
-            # Clean up - file is now closed so Windows can delete it
-            Path(temp_path).unlink(missing_ok=True)
+        guardrails_config = load_guardrails_from_string(yaml_content)
+        assert "input_guardrails" not in guardrails_config or not guardrails_config.get(
+            "input_guardrails"
+        )
 
     def test_instantiate_pii_detector_from_config(self):
         """Test creating PIIDetector instance from YAML config."""
@@ -112,21 +85,26 @@ input_guardrails:
     function: "validators.no_sql_injection"
     description: "Prevents SQL injection attempts"
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            guardrails_config = load_guardrails_from_yaml(temp_path)
-            assert guardrails_config["input_guardrails"][0]["function"] == "validators.no_sql_injection"
-            assert (
-                guardrails_config["input_guardrails"][0]["description"]
-                == "Prevents SQL injection attempts"
-            )
-        finally:
-            # Clean up - file is now closed so Windows can delete it
-            Path(temp_path).unlink(missing_ok=True)
+        guardrails_config = load_guardrails_from_string(yaml_content)
+        assert guardrails_config["input_guardrails"][0]["function"] == "validators.no_sql_injection"
+        assert (
+            guardrails_config["input_guardrails"][0]["description"]
+            == "Prevents SQL injection attempts"
+        )
+
+    def test_load_from_file_matches_string(self, tmp_path):
+        """Test the file loader parses the same config as the string loader."""
+        yaml_content = 'input_guardrails:\n  - type: "pii_detector"\n'
+        config_file = tmp_path / "guardrails.yaml"
+        config_file.write_text(yaml_content)
+
+        assert load_guardrails_from_yaml(str(config_file)) == load_guardrails_from_string(
+            yaml_content
+        )
+
+    def test_load_empty_string(self):
+        """Test an empty YAML document loads as an empty config."""
+        assert load_guardrails_from_string("") == {}
 
     def test_load_nonexistent_file(self):
         """Test loading from nonexistent YAML file."""
@@ -1,5 +1,7 @@
 """Unit tests for guardrail classes - TDD approach."""
 
+import time
+
 import pytest
 
 from simple_agent.guardrails.input_validators import PIIDetector
@@ -47,6 +49,47 @@ class TestPIIDetector:
         with pytest.raises(GuardrailViolation):
             detector.process(text)
 
+    def test_email_redaction_keeps_surrounding_punctuation(self):
+        """Test the fenced email pattern stops at the address boundaries."""
+        detector = PIIDetector(types=["email"], redact=True)
+        result = detector.process("Mail (john.doe@example.com).")
+        assert result == "Mail ([EMAIL])."
+
+    def test_reject_reports_matched_type(self):
+        """Test reject mode names the PII type and value that matched."""
+        detector = PIIDetector(types=["email", "ssn"], redact=False)
+        with pytest.raises(GuardrailViolation, match="Found ssn: 123-45-6789"):
+            detector.process("SSN 123-45-6789 on file")
+
+    def test_detectors_share_compiled_pattern(self):
+        """Test detectors with the same types reuse one compiled regex."""
+        first = PIIDetector(types=["email", "ssn"], redact=True)
+        second = PIIDetector(types=["email", "ssn"], redact=False)
+        assert first._pattern is second._pattern
+
+    def test_assigning_types_recompiles_pattern(self):
+        """Test changing types after construction changes what is detected."""
+        detector = PIIDetector(types=["email"], redact=True)
+        assert detector.process("SSN 123-45-6789") == "SSN 123-45-6789"
+
+        detector.types = ["email", "ssn"]
+
+        assert detector.types == ("email", "ssn")
+        assert detector.process("SSN 123-45-6789") == "SSN [SSN]"
+
+    @pytest.mark.parametrize(
+        "text",
+        [" " * 20000, "a." * 10000],
+        ids=["whitespace_run", "dotted_run"],
+    )
+    def test_long_runs_scan_in_linear_time(self, text):
+        """Test inputs that made the patterns backtrack quadratically stay fast."""
+        detector = PIIDetector(types=["email", "phone", "ssn"], redact=True)
+        start = time.perf_counter()
+        result = detector.process(text)
+        assert result == text
+        assert time.perf_counter() - start < 1.0
+
     def test_multiple_pii_types(self):
         """Test detection of multiple PII types."""
         detector = PIIDetector(types=["email", "phone", "ssn"], redact=True)
@@ -93,6 +136,20 @@ class TestPIIDetector:
         result3 = detector.process(text3)
         assert "[PHONE]" in result3
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Call +1 555-123-4567 now", "Call [PHONE] now"),
+            ("Call 1 555 123 4567", "Call [PHONE]"),
+            ("Call +15551234567.", "Call [PHONE]."),
+        ],
+        ids=["plus_one_space", "one_space", "plus_one_compact"],
+    )
+    def test_phone_country_code_is_redacted(self, text, expected):
+        """Test the +1/1 country code is redacted along with the number."""
+        detector = PIIDetector(types=["phone"], redact=True)
+        assert detector.process(text) == expected
+
     def test_email_variations(self):
         """Test different email formats."""
         detector = PIIDetector(types=["email"], redact=True)
@@ -4,6 +4,8 @@ Unit tests for /history commands (Phase 1.2).
 Tests the history management commands.
 """
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
@@ -264,6 +266,21 @@ class TestHistorySaveCommand:
         assert "steps" in saved_data
         assert saved_data["steps"] == expected_steps
 
+    def test_save_jsonl_writes_one_step_per_line(
+        self, runner: CliRunner, mock_context: dict, tmp_path: Path
+    ) -> None:
+        """Test that a .jsonl target gets one JSON object per memory step."""
+        export_file = tmp_path / "history.jsonl"
+
+        result = runner.invoke(history, ["save", str(export_file)], obj=mock_context)
+
+        assert result.exit_code == 0
+        lines = export_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"type": "task", "task": "What is 2+2?"},
+            {"type": "action", "result": "4"},
+        ]
+
     def test_save_shows_confirmation(
         self, runner: CliRunner, mock_context: dict
     ) -> None:
@@ -266,6 +266,81 @@ class TestApprovalManagerHistory:
             manager.clear_history()
             assert len(manager.get_history()) == 0
 
+    def test_get_history_loads_persistence_once(self):
+        """Test repeated reads reuse history until a new decision is recorded."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            persistence = FileApprovalPersistence(storage_dir=tmpdir)
+            manager = ApprovalManager(
+                persistence=persistence,
+                enable_interactive=False,
+            )
+            manager.request_approval(tool_name="test1", prompt="Test?")
+            manager.approve()
+
+            with patch.object(
+                persistence, "load_history", wraps=persistence.load_history
+            ) as load_history:
+                manager.get_history()
+                manager.get_history(limit=1)
+                assert load_history.call_count == 1
+
+                manager.request_approval(tool_name="test2", prompt="Test?")
+                manager.reject()
+                assert len(manager.get_history()) == 2
+                assert load_history.call_count == 2
+
+    def test_get_history_sees_decisions_from_other_managers(self):
+        """Test cached history reloads when another writer changes the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            reader = ApprovalManager(
+                persistence=FileApprovalPersistence(storage_dir=tmpdir),
+                enable_interactive=False,
+            )
+            writer = ApprovalManager(
+                persistence=FileApprovalPersistence(storage_dir=tmpdir),
+                enable_interactive=False,
+            )
+            assert reader.get_history() == []
+
+            writer.request_approval(tool_name="test", prompt="Test?")
+            writer.approve()
+
+            history = reader.get_history()
+            assert len(history) == 1
+            assert history[0]["tool_name"] == "test"
+
+    @pytest.mark.parametrize("limit", [None, 1], ids=["all", "limited"])
+    def test_get_history_returns_copies(self, limit):
+        """Test editing returned records does not change the cached history."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = ApprovalManager(
+                persistence=FileApprovalPersistence(storage_dir=tmpdir),
+                enable_interactive=False,
+            )
+            manager.request_approval(tool_name="test", prompt="Test?")
+            manager.approve()
+
+            manager.get_history(limit=limit)[0]["decision"] = "edited"
+
+            assert manager.get_history(limit=limit)[0]["decision"] == "approved"
+
+    def test_in_memory_history_is_bounded(self):
+        """Test the in-memory history keeps only the newest history_limit entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            persistence = FileApprovalPersistence(storage_dir=tmpdir)
+            manager = ApprovalManager(
+                persistence=persistence,
+                enable_interactive=False,
+                history_limit=2,
+            )
+
+            for i in range(3):
+                manager.request_approval(tool_name=f"tool_{i}", prompt="Test?")
+                manager.approve()
+
+            assert [e["tool_name"] for e in manager.history] == ["tool_1", "tool_2"]
+            assert len(manager.get_history()) == 3
+
 
 class TestApprovalManagerIntegration:
     """Integration tests for ApprovalManager."""
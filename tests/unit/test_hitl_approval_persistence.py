@@ -29,16 +29,27 @@ class TestFileApprovalPersistenceCreation:
             assert storage_path.exists()
 
     def test_initialization_creates_empty_files(self):
-        """Test that initialization creates empty JSON files."""
+        """Test that initialization creates an empty requests JSON and history log."""
         with tempfile.TemporaryDirectory() as tmpdir:
             persistence = FileApprovalPersistence(storage_dir=tmpdir)
 
-            # Verify files exist and are valid JSON
+            # Requests are a JSON object; history is an empty JSON Lines file
             requests_data = json.loads(persistence.requests_file.read_text())
-            history_data = json.loads(persistence.history_file.read_text())
+            history_data = persistence.history_file.read_text()
 
             assert requests_data == {}
-            assert history_data == []
+            assert history_data == ""
+
+    def test_migrates_legacy_json_history(self):
+        """Test a pre-JSON Lines approval_history.json is carried over."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = [{"request_id": "req-1", "decision": "approved"}]
+            (Path(tmpdir) / "approval_history.json").write_text(json.dumps(legacy))
+
+            persistence = FileApprovalPersistence(storage_dir=tmpdir)
+
+            assert persistence.load_history() == legacy
+            assert not (Path(tmpdir) / "approval_history.json").exists()
 
 
 class TestFileApprovalPersistenceSaveLoad:
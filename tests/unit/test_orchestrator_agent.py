@@ -4,10 +4,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from simple_agent.agents.simple_agent import SimpleAgent
 from simple_agent.orchestration.agent_tool import AgentTool
 from simple_agent.orchestration.orchestrator_agent import OrchestratorAgent
 
+# SimpleAgent attributes AgentTool touches; spec_set rejects anything else
+_SUB_AGENT_ATTRS = ["name", "run"]
+
 
 class TestOrchestratorAgent:
     """OrchestratorAgent coordinates execution of sub-agents."""
@@ -15,13 +17,13 @@ class TestOrchestratorAgent:
     @pytest.fixture
     def mock_agents(self):
         """Create mock sub-agents."""
-        researcher = MagicMock(spec=SimpleAgent)
+        researcher = MagicMock(spec_set=_SUB_AGENT_ATTRS)
         researcher.name = "researcher"
-        researcher.run = MagicMock(return_value="Research findings: ...\n")
+        researcher.run.return_value = "Research findings: ...\n"
 
-        writer = MagicMock(spec=SimpleAgent)
+        writer = MagicMock(spec_set=_SUB_AGENT_ATTRS)
         writer.name = "writer"
-        writer.run = MagicMock(return_value="Final article: ...\n")
+        writer.run.return_value = "Final article: ...\n"
 
         return {"researcher": researcher, "writer": writer}
 
@@ -256,6 +256,33 @@ class TestIndexVersioning:
         assert info["requires_reindex"] is True
 
 
+class TestAddDocumentsBatching:
+    """Test documents are written to Chroma in bounded batches."""
+
+    def test_add_documents_splits_into_batches(self):
+        """Test large adds are split into ADD_BATCH_SIZE calls, in order."""
+        mock_chroma = Mock()
+        collection = Collection("test", mock_chroma, {})
+        count = Collection.ADD_BATCH_SIZE * 2 + 1
+        documents = [
+            {"id": f"doc_{i}", "content": f"text {i}", "source": "a.txt"}
+            for i in range(count)
+        ]
+        metadata_list = [{"chunk_index": i, "author": None} for i in range(count)]
+
+        collection.add_documents(documents, metadata_list)
+
+        calls = mock_chroma.add.call_args_list
+        assert [len(c.kwargs["ids"]) for c in calls] == [
+            Collection.ADD_BATCH_SIZE,
+            Collection.ADD_BATCH_SIZE,
+            1,
+        ]
+        assert [i for c in calls for i in c.kwargs["ids"]] == [d["id"] for d in documents]
+        assert calls[-1].kwargs["metadatas"] == [{"chunk_index": count - 1}]
+        assert collection.metadata["document_count"] == count
+
+
 class TestDocumentValidationError:
     """Test DocumentValidationError exception."""
 
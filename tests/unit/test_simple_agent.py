@@ -666,6 +666,36 @@ Available tools:
         except ValueError as e:
             assert "jinja2" in str(e).lower() or "template" in str(e).lower()
 
+    @patch("simple_agent.agents.model_factory.LiteLLMModel")
+    @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
+    def test_jinja2_template_compiled_once(
+        self, mock_tool_calling_agent: Mock, mock_litellm: Mock
+    ) -> None:
+        """Test agents sharing a Jinja2 role reuse one compiled template."""
+        from simple_agent.agents import template_renderer
+
+        model_config = {"model": "gpt-4o-mini", "api_key": "sk-test"}
+        role_template = "You are {{ agent_name }}, compiled once."
+
+        with patch.object(
+            template_renderer._shared_jinja_env(),
+            "from_string",
+            wraps=template_renderer._shared_jinja_env().from_string,
+        ) as from_string:
+            template_renderer._compile_template.cache_clear()
+            first = SimpleAgent(
+                name="FirstBot", model_provider="openai",
+                model_config=model_config, role=role_template,
+            )
+            second = SimpleAgent(
+                name="SecondBot", model_provider="openai",
+                model_config=model_config, role=role_template,
+            )
+
+        assert first.role == "You are FirstBot, compiled once."
+        assert second.role == "You are SecondBot, compiled once."
+        from_string.assert_called_once_with(role_template)
+
     @patch("simple_agent.agents.model_factory.LiteLLMModel")
     @patch("simple_agent.agents.simple_agent.ToolCallingAgent")
     def test_jinja2_context_variables(
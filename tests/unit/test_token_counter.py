@@ -1,6 +1,9 @@
 """Unit tests for token counter utility."""
+from unittest.mock import Mock, patch
+
 import pytest
 
+from simple_agent.tools.helpers import token_counter
 from simple_agent.tools.helpers.token_counter import estimate_tokens
 
 
@@ -211,3 +214,49 @@ print(result)
         """
         tokens = estimate_tokens(code)
         assert tokens > 0
+
+
+class TestEncodingCache:
+    """Test the tiktoken encoding is loaded once per process."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_encoding_cache(self, monkeypatch):
+        """Start and finish each test with an empty encoding cache."""
+        token_counter._get_encoding.cache_clear()
+        monkeypatch.setattr(token_counter, "_last_load_failure", None)
+        yield
+        token_counter._get_encoding.cache_clear()
+
+    def test_encoding_loaded_once(self):
+        """Repeated counts reuse one get_encoding() result."""
+        encoding = Mock(spec=["encode"])
+        encoding.encode.return_value = [1, 2, 3]
+        with patch.object(
+            token_counter.tiktoken, "get_encoding", return_value=encoding
+        ) as get_encoding:
+            estimate_tokens("hello world")
+            assert estimate_tokens("hello again") == 3
+
+        assert get_encoding.call_count == 1
+
+    def test_failed_load_is_retried_after_cooldown(self):
+        """A failed load is not cached: the fallback is used until a retry succeeds."""
+        text = "hello world this is a test"
+        encoding = Mock(spec=["encode"])
+        encoding.encode.return_value = [1, 2, 3]
+        with patch.object(
+            token_counter.tiktoken,
+            "get_encoding",
+            side_effect=[OSError("offline"), encoding],
+        ) as get_encoding:
+            first = estimate_tokens(text)
+            second = estimate_tokens(text)
+            assert get_encoding.call_count == 1
+
+            token_counter._last_load_failure -= token_counter.ENCODING_RETRY_SECONDS
+            third = estimate_tokens(text)
+            fourth = estimate_tokens(text)
+
+        assert first == second == token_counter._estimate_tokens_fallback(text)
+        assert third == fourth == 3
+        assert get_encoding.call_count == 2